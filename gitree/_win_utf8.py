@@ -0,0 +1,13 @@
+# gitree/_win_utf8.py
+
+"""
+Windows-only shim, imported by main.py when running on Windows.
+
+Switches stdout to UTF-8 so the tree characters and emojis can be printed
+on legacy console code pages (fixes the windows unicode error on CI).
+"""
+
+# Default libs
+import sys
+
+sys.stdout.reconfigure(encoding='utf-8')
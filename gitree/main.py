@@ -6,23 +6,19 @@ Code file for housing the main function.
 
 # Default libs
 import sys, time
-if sys.platform.startswith('win'):      # fix windows unicode error on CI
-    sys.stdout.reconfigure(encoding='utf-8')
+if sys.platform == 'win32':      # fix windows unicode error on CI
+    from . import _win_utf8
 
 # Deps from this project
+# NOTE: services used only by some runs (zip, export, copy, interactive)
+# are imported inside main() where they are needed, to keep startup fast
 from .services.parsing import ParsingService
 from .services.general_options_service import GeneralOptionsService
 from .services.items_selection import ItemsSelectionService
 from .services.drawing_service import DrawingService
-from .services.zipping_service import ZippingService
-from .services.export_service import ExportService
-from .services.copy_service import CopyService
 from .services.flush_service import FlushService
-
-# from .services.zipping_service import ZippingService
 from .objects.app_context import AppContext
 from .utilities.logging_utility import Logger
-from .services.interactive_selection_service import InteractiveSelectionService
 
 
 def main() -> None:
@@ -43,6 +39,11 @@ def main() -> None:
     # Prepare the config object (this has all the args now)
     config = ParsingService.run(ctx)
 
+    # The log is only printed in verbose mode, otherwise stop collecting it
+    if not config.verbose:
+        ctx.logger.enabled = False
+        ctx.logger.clear()
+
 
     # if general options used, they are executed here
     # Handles for --version, --config-user, --no-config
@@ -57,31 +58,39 @@ def main() -> None:
     # Select files interactively if requested
     # NOTE: this one is currently broken
     if config.interactive:
-        checkpoint_time = time.time()       # Pause the timer when the user is selecting
+        from .services.interactive_selection_service import InteractiveSelectionService
+        if config.verbose:
+            checkpoint_time = time.time()       # Pause the timer when the user is selecting
         resolved_root = InteractiveSelectionService.run(ctx, config, resolved_root)
-        start_time += (time.time() - checkpoint_time)   # Resume the timer
+        if config.verbose:
+            start_time += (time.time() - checkpoint_time)   # Resume the timer
 
 
     # Everything is ready
     # Now do the final operations
     if config.zip:
+        from .services.zipping_service import ZippingService
         ZippingService.run(ctx, config, resolved_root)
 
     else:
         DrawingService.run(ctx, config, resolved_root)
-        ctx.logger.log(Logger.INFO, 
-            f"Left DrawingService at: {round((time.time()-start_time)*1000, 2)} ms")
+        if config.verbose:
+            ctx.logger.log(Logger.INFO, 
+                f"Left DrawingService at: {round((time.time()-start_time)*1000, 2)} ms")
         
         if config.copy:
+            from .services.copy_service import CopyService
             CopyService.run(ctx, config, resolved_root)
 
         elif config.export:
+            from .services.export_service import ExportService
             ExportService.run(ctx, config, resolved_root)
 
 
-    # Log performance (time)
-    ctx.logger.log(Logger.INFO, 
-        f"Total time for this run: {round((time.time()-start_time)*1000, 2)} ms")
+    # Log performance (time), the log is only printed in verbose mode
+    if config.verbose:
+        ctx.logger.log(Logger.INFO, 
+            f"Total time for this run: {round((time.time()-start_time)*1000, 2)} ms")
 
 
     # Flush the buffers to the console before exiting
@@ -5,32 +5,105 @@ Code file to house Config class.
 """
 
 # Default libs
-import argparse, json, os, sys, subprocess, platform
+import argparse, os, sys, subprocess, platform
 from pathlib import Path
-from typing import Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
 
 # Deps from this project
 from .app_context import AppContext
+from ..utilities import json_utility
 from ..utilities.logging_utility import Logger
 from ..utilities.functions_utility import error_and_exit
 
 
+# Default configuration values, built once at import. Only ever read: callers get a
+# copy from Config._build_default_config() or the read-only view below.
+# NOTE: list values are shared with every merged config, never modify them in place
+_DEFAULT_CONFIG: dict[str, Any] = {
+    # Output & export options
+    "zip": "",
+    "export": "",
+
+    # Listing options
+    "format": "tree",
+    "max_items": 20,
+    "max_entries": 40,
+    "max_depth": 1,
+    "gitignore_depth": 5,
+    "hidden_items": False,
+    "exclude": [],
+    "exclude_depth": 5,
+    "always_skip_dirs": [
+        ".git", "node_modules", "__pycache__", ".venv", "venv", ".tox",
+        ".mypy_cache", ".pytest_cache", "dist", "build", "target", ".next",
+    ],
+    "include": [],
+    "include_file_types": [],
+    "file_extensions": [],  # For --only-types optimization
+    "files_first": False,
+    "no_color": False,
+    "no_contents": False,
+    "no_contents_for": [],
+    "override_files": True,
+    "max_file_size": 1.0,
+
+    # Listing override options
+    "gitignore": False,
+    "no_files": False,
+    "no_max_items": False,
+    "no_max_entries": False,
+
+    # Inner tool control (not to be given to the user)
+    "no_printing": False,
+
+    # Other args
+    "copy": False,
+    "config_user": False,
+    "version": False,
+    "interactive": False,
+    "emoji": False,
+    "verbose": False,
+    "no_max_depth": False,
+    "size": False,
+}
+_DEFAULT_CONFIG_RO = MappingProxyType(_DEFAULT_CONFIG)
+
+
+# Parsed user config, keyed by (absolute path, mtime in ns) of config.json
+_USER_CFG_CACHE: tuple[str, int, dict[str, Any]] | None = None
+
+
 class Config:
     def __init__(self, ctx: AppContext, args: argparse.Namespace):
         """ 
         Config declared here from lowest to highest priority.
         Initializer to build four types of config.
+
+        All four are merged once here, so every config value afterwards is
+        a plain instance attribute (no per-read precedence lookup).
         """
-        self.defaults: dict[str, Any] = self._build_default_config()
-        self.global_cfg: dict[str, Any] = {}
-        self.user_cfg: dict[str, Any] = self._build_user_config()
-        self.cli: dict[str, Any] = vars(args)
+        # Read-only view, the merge below copies the values out of it
+        defaults: Mapping[str, Any] = _DEFAULT_CONFIG_RO
+        global_cfg: dict[str, Any] = {}
+        user_cfg: dict[str, Any] = self._build_user_config()
+        cli: dict[str, Any] = vars(args)
 
 
         # Disable user- and global-level configuration if --no-config is used
         if hasattr(args, "no_config"):
-            self.user_cfg = {}
-            self.global_cfg = {}
+            user_cfg = {}
+            global_cfg = {}
+
+
+        # Precedence: CLI > user > global > defaults
+        self.__dict__.update({**defaults, **global_cfg, **user_cfg, **cli})
+
+        self.defaults = defaults
+        self.global_cfg = global_cfg
+        self.user_cfg = user_cfg
+        self.cli = cli
 
 
     def _build_user_config(self) -> dict[str, Any]:
@@ -38,104 +111,45 @@ class Config:
         Returns a dict of the user config, if available.
         """
 
-        config_path = Config._get_user_config_path()
-
-        # Make sure the configuration file has been setup
-        if not os.path.exists(config_path): return {}
-
-        with open(config_path, "r") as file:
-            user_cfg = json.load(file)
-
-        return user_cfg
-    
+        global _USER_CFG_CACHE
 
-    def _get(self, key: str) -> Any:
-        """
-        Returns the value of the key with the following precedence:
+        config_path = os.path.abspath(Config._get_user_config_path())
 
-        Precedence: CLI > user > global > defaults > fallback default
-        """
+        # Make sure the configuration file has been setup
+        try:
+            mtime_ns = os.stat(config_path).st_mtime_ns
+        except OSError:
+            return {}
 
-        if key in self.cli:
-            return self.cli[key]
-        if key in self.user_cfg:
-            return self.user_cfg[key]
-        if key in self.global_cfg:
-            return self.global_cfg[key]
-        if key in self.defaults:
-            return self.defaults[key]
-        
-        raise KeyError      # If key was not in any of the dicts
+        # Reuse the parsed config if the file has not changed since
+        cached = _USER_CFG_CACHE
+        if cached is not None and cached[0] == config_path and cached[1] == mtime_ns:
+            return dict(cached[2])
 
+        # One read of the raw bytes, orjson parses them without decoding first
+        user_cfg = json_utility.loads(Path(config_path).read_bytes())
 
-    def __getattr__(self, name: str) -> Any:
-        """
-        Allow attribute-style access:
-        cfg.max_items converted to cfg.get("max_items")
-        """
-        try:
-            return self._get(name)
-        except KeyError:
-            raise AttributeError(f"'Config' object has no attribute '{name}'")
-
+        _USER_CFG_CACHE = (config_path, mtime_ns, user_cfg)
+        return dict(user_cfg)
+    
 
     @staticmethod
     def _build_default_config() -> dict[str, Any]:
         """
-        Returns the default configuration values.
+        Returns a copy of the default configuration values, safe to modify.
+        Readers that only merge the defaults use _DEFAULT_CONFIG_RO instead.
 
         NOTE: This contains only listing options and IO options.
         Semantic flags and general options are processed separately and not stored here.
         """
 
-        return {
-            # Output & export options
-            "zip": "",
-            "export": "",
-
-            # Listing options
-            "format": "tree",
-            "max_items": 20,
-            "max_entries": 40,
-            "max_depth": 1,
-            "gitignore_depth": 5,
-            "hidden_items": False,
-            "exclude": [],
-            "exclude_depth": 5,
-            "include": [],
-            "include_file_types": [],
-            "file_extensions": [],  # For --only-types optimization
-            "files_first": False,
-            "no_color": False,
-            "no_contents": False,
-            "no_contents_for": [],
-            "override_files": True,
-            "max_file_size": 1.0,
-
-            # Listing override options
-            "gitignore": False,
-            "no_files": False,
-            "no_max_items": False,
-            "no_max_entries": False,
-
-            # Inner tool control (not to be given to the user)
-            "no_printing": False,
-
-            # Other args
-            "copy": False,
-            "config_user": False,
-            "version": False,
-            "interactive": False,
-            "emoji": False,
-            "verbose": False,
-            "no_max_depth": False,
-            "size": False,
-        }
+        return _DEFAULT_CONFIG.copy()
     
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _get_user_config_path() -> Path:
-        """ Return the default user config path for gitree """
+        """ Return the default user config path for gitree (relative to the cwd) """
         path = Path(".gitree/config.json")
         return path
 
@@ -145,6 +159,10 @@ class Config:
         """
         Creates a default config.json file with all defaults.
         """
+        # NOTE: Only needed to write the file here, runs that just read the
+        # config parse it through json_utility
+        import json
+
         config_path = Config._get_user_config_path()
         config_path.parent.mkdir(exist_ok=True, parents=True)
 
@@ -169,7 +187,7 @@ class Config:
                 f.write('\n')
 
 
-            ctx.logger.log(Logger.DEBUG, f"Created config.json at {config_path.absolute()}")
+            ctx.logger.log(Logger.DEBUG, "Created config.json at %s", config_path.absolute())
             ctx.logger.log(Logger.DEBUG, 
                 "Edit this file to customize default settings for this project.")
 
@@ -187,7 +205,7 @@ class Config:
 
         # Create config if it doesn't exist
         if not config_path.exists():
-            ctx.logger.log(Logger.INFO, f"config.json not found. Creating default config...")
+            ctx.logger.log(Logger.INFO, "config.json not found. Creating default config...")
             Config.create_default_config(ctx)
 
         # Try to get editor from environment variable first
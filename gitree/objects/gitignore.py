@@ -5,8 +5,10 @@ Code file for housing GitIgnore class with performance optimizations.
 """
 
 # Default libs
+import os
+import re
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Any, Callable, Iterable, Optional
 
 # Dependencies
 import pathspec
@@ -16,6 +18,82 @@ from ..objects.app_context import AppContext
 from ..objects.config import Config
 
 
+# Matches a relative path against the patterns of one .gitignore, truthy if ignored
+Matcher = Callable[[str], Any]
+
+# Compiled matchers of parsed .gitignore files, keyed by (resolved path, size, mtime in ns).
+# The same file reached again (symlinks, repeated runs in one process) is not re-parsed.
+_SPEC_CACHE: dict[tuple[str, int, int], Optional[Matcher]] = {}
+
+# Compiled matchers by their patterns, so identical .gitignore files (the same
+# template in every package of a monorepo, copies of a tree) compile only once
+_MATCHER_CACHE: dict[tuple[str, ...], Matcher] = {}
+
+
+def _never_match(rel: str) -> bool:
+    """
+    Matcher of a .gitignore without active patterns, excludes nothing.
+    """
+    return False
+
+
+def _compile_matcher(spec: pathspec.PathSpec) -> Matcher:
+    """
+    Compile the patterns of a spec into a single regex alternation.
+
+    PathSpec.match_file() runs one regex per pattern and keeps the last match, as
+    a later "!pattern" can re-include a path. Without negations any match means
+    excluded, so one combined regex (a single C-level match call) gives the same
+    result. Specs with negations keep PathSpec.match_file().
+
+    Args:
+        spec: The compiled spec of one .gitignore
+
+    Returns:
+        Matcher: A function of the relative posix path, truthy if it is excluded
+    """
+    sources: list[str] = []
+
+    for pattern in spec.patterns:
+        if pattern.include is None:     # Blank and comment lines
+            continue
+
+        regex = getattr(pattern, "regex", None)
+        if not pattern.include or regex is None:
+            return spec.match_file
+
+        # The group names repeat across patterns, an alternation allows them only once
+        sources.append(regex.pattern.replace("(?P<ps_d>", "(?:"))
+
+    # No active pattern (only blank lines, or a bare "/"), nothing is excluded.
+    # An empty alternation would be the empty regex, which matches every path
+    if not sources:
+        return _never_match
+
+    try:
+        return re.compile("|".join(f"(?:{source})" for source in sources)).match
+    except re.error:
+        return spec.match_file
+
+
+def _matcher_for(patterns: list[str]) -> Matcher:
+    """
+    Get the compiled matcher of gitignore patterns, compiled once per distinct list.
+
+    Args:
+        patterns: Normalized gitignore patterns, in file order
+
+    Returns:
+        Matcher: A function of the relative posix path, truthy if it is excluded
+    """
+    key = tuple(patterns)
+    match = _MATCHER_CACHE.get(key)
+    if match is None:
+        match = _MATCHER_CACHE[key] = _compile_matcher(
+            pathspec.PathSpec.from_lines("gitwildmatch", patterns))
+    return match
+
+
 class GitIgnore:
     """
     Optimized gitignore loader/matcher with caching and performance improvements.
@@ -46,8 +124,8 @@ class GitIgnore:
         self.enabled = config.gitignore
         self.gitignore_depth = config.gitignore_depth
 
-        # Setup specs for gitignore
-        self._specs: list[tuple[Path, pathspec.PathSpec]]
+        # Setup matchers for gitignore, one per root
+        self._specs: list[tuple[Path, Matcher]]
         
         # Cache for relative path computations: (path, root) -> relative_path
         self._rel_path_cache: dict[tuple[str, str], Optional[str]] = {}
@@ -58,12 +136,16 @@ class GitIgnore:
         self._load_spec_from_gitignore(gitignore_path)
 
 
-    def excluded(self, item_path: Path) -> bool:
+    def excluded(self, item_path: Path, is_dir: Optional[bool] = None,
+                 resolved: bool = False) -> bool:
         """
         Optimized exclusion check with path caching.
 
         Args:
             item_path (Path): The path to check for exclusion
+            is_dir (Optional[bool]): Whether the path is a directory, if already known
+            resolved (bool): Whether item_path is already resolved, skips the resolve()
+                (an lstat per path component)
 
         Returns:
             bool: True if the path is ignored/excluded, otherwise False
@@ -71,11 +153,12 @@ class GitIgnore:
         if not self.enabled:
             return False
 
-        # Resolve path once
-        p = item_path.resolve(strict=False)
-        is_dir = p.is_dir()
+        # Resolve path once, unless the caller knows it has no symlink in it
+        p = item_path if resolved else item_path.resolve(strict=False)
+        if is_dir is None:
+            is_dir = p.is_dir()
         
-        for root, spec in self._specs:
+        for root, match in self._specs:
             # Use cached relative path computation
             rel = self._get_relative_path_cached(p, root)
             
@@ -83,11 +166,11 @@ class GitIgnore:
                 continue
 
             # Check file match
-            if spec.match_file(rel):
+            if match(rel):
                 return True
             
             # Check directory match (only if it's actually a directory)
-            if is_dir and spec.match_file(rel + "/"):
+            if is_dir and match(rel + "/"):
                 return True
 
         return False
@@ -132,7 +215,7 @@ class GitIgnore:
         for root in self._norm_roots(roots):
             pats = self._collect_patterns(root)
             if pats:  # Only add if there are patterns
-                self._specs.append((root, pathspec.PathSpec.from_lines("gitwildmatch", pats)))
+                self._specs.append((root, _matcher_for(pats)))
 
 
     def _load_spec_from_gitignore(self, gitignore_path: Path) -> None:
@@ -149,10 +232,25 @@ class GitIgnore:
         root = gi.parent
         self.root_path = root
 
-        patterns = self._parse_gitignore_file(gi)
-        
-        if patterns:  # Only create spec if there are patterns
-            self._specs.append((root, pathspec.PathSpec.from_lines("gitwildmatch", patterns)))
+        # Reuse the compiled spec if the file has not changed since
+        try:
+            st = os.stat(gi)
+            cache_key = (str(gi), st.st_size, st.st_mtime_ns)
+        except OSError:
+            cache_key = None
+
+        if cache_key is not None and cache_key in _SPEC_CACHE:
+            match = _SPEC_CACHE[cache_key]
+        else:
+            patterns = self._parse_gitignore_file(gi)
+
+            # Only create a matcher if there are patterns
+            match = _matcher_for(patterns) if patterns else None
+            if cache_key is not None:
+                _SPEC_CACHE[cache_key] = match
+
+        if match is not None:
+            self._specs.append((root, match))
 
 
     def _parse_gitignore_file(self, gitignore_path: Path) -> list[str]:
@@ -299,9 +397,11 @@ class GitIgnore:
             if not self._within_depth(root, d):
                 continue
 
+            # scandir entries know their type from the listing, no stat() per child
             try:
-                for c in d.iterdir():
-                    if c.is_dir() and not c.is_symlink():
-                        stack.append(c)
+                with os.scandir(d) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(d / entry.name)
             except (PermissionError, OSError):
                 continue
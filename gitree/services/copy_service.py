@@ -6,9 +6,6 @@ Code file for housing CopyService Class.
 Static methods; copies exported output to clipboard
 """
 
-# Dependencies
-import pyperclip
-
 # Deps from this project
 from ..objects.app_context import AppContext
 from ..objects.config import Config
@@ -45,6 +42,9 @@ class CopyService:
         elif fmt == "json":
             lines = ExportService._export_json(ctx, config, tree_data)
 
+        # Imported here, pyperclip loads platform clipboard shims on import
+        import pyperclip
+
         try:
             pyperclip.copy("\n".join(lines))
         except Exception as e:
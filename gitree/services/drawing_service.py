@@ -7,9 +7,9 @@ Static methods; draws into the output_buffer in AppContext
 """
 
 # Default libs
+import os
 from typing import Any
-import json
-from pathlib import Path
+from pathlib import Path, PurePath
 from shutil import get_terminal_size
 
 # Deps from this project
@@ -76,10 +76,21 @@ class DrawingService:
                 return EMPTY_DIR_EMOJI if len(ch) == 0 else NORMAL_DIR_EMOJI
             return FILE_EMOJI
 
+        def _sort_name(c: Any) -> str:
+            x = c["self"] if isinstance(c, dict) else c
+            # Path.name is already the last component, no posix string to build and split
+            return (x.name if isinstance(x, PurePath) else _name(_p(x))).lower()
+
+        # Sort keys are (kind, lowercased name) tuples, computed once per child
+        if config.files_first:
+            def _sort_key(c: Any) -> tuple[bool, str]:
+                return (isinstance(c, dict), _sort_name(c))
+        else:
+            def _sort_key(c: Any) -> tuple[bool, str]:
+                return (not isinstance(c, dict), _sort_name(c))
+
         def _children_sorted(children: list[Any]) -> list[Any]:
-            if config.files_first:
-                return sorted(children, key=lambda c: (0 if not _is_dir(c) else 1, _name(_p(c.get("self") if _is_dir(c) else c)).lower()))
-            return sorted(children, key=lambda c: (0 if _is_dir(c) else 1, _name(_p(c.get("self") if _is_dir(c) else c)).lower()))
+            return sorted(children, key=_sort_key)
 
         def _write_line(prefix: str, connector: str, node: Any) -> None:
             p = _p(node.get("self") if _is_dir(node) else node)
@@ -137,38 +148,47 @@ class DrawingService:
             ctx.output_buffer.write(f"{Color.cyan(root_label) if not config.no_color else root_label}")
 
 
-        def _rec(node: dict[str, Any], prefix: str, truncated_entries: bool) -> None:
+        def _open(node: dict[str, Any], prefix: str) -> tuple[str, Any, int, int]:
             kids = _children_sorted(node.get("children", []))
             remaining = int(node.get("remaining_items", 0) or 0)
 
             # If we will print the truncation message, treat it as an extra final line
             total_lines = len(kids) + (1 if remaining > 0 else 0)
+            return prefix, enumerate(kids), total_lines, remaining
+
 
-            for i, child in enumerate(kids):
+        # Iterative depth-first walk with an explicit stack, one frame per open dir.
+        # Descending into a dir pauses its parent's children iterator, so lines come
+        # out in the same order as a recursive walk, without a call per directory.
+        stack = [_open(tree_data, "")]
+        while stack:
+            prefix, kids, total_lines, remaining = stack[-1]
+
+            for i, child in kids:
                 connector = LAST if i == total_lines - 1 else BRANCH
                 _write_line(prefix, connector, child)
 
                 if _is_dir(child):
-                    next_prefix = prefix + (SPACE if connector == LAST else VERT)
-                    _rec(child, next_prefix, truncated_entries)  # <-- pass it through
-
-            if remaining > 0:
-                msg = f"... and {remaining} more items"
-                connector = LAST
+                    stack.append(_open(child, prefix + (SPACE if connector == LAST else VERT)))
+                    break
 
-                if config.no_color:
-                    ctx.output_buffer.write(f"{prefix}{connector}{msg}")
-                else:
-                    ctx.output_buffer.write(f"{prefix}{connector}{Color.grey(msg)}")
+            else:
+                stack.pop()
 
-            # Only print this ONCE: at the very end of the whole output (root call)
-            if prefix == "" and truncated_entries:
-                ctx.tips_buffer.write(
-                    "some entries were truncated, use '-n' to show all entries", 
-                    no_color=config.no_color)
+                if remaining > 0:
+                    msg = f"... and {remaining} more items"
+                    connector = LAST
 
+                    if config.no_color:
+                        ctx.output_buffer.write(f"{prefix}{connector}{msg}")
+                    else:
+                        ctx.output_buffer.write(f"{prefix}{connector}{Color.grey(msg)}")
 
-        _rec(tree_data, "", bool(tree_data.get("truncated_entries", False)))
+        # Only print this ONCE: at the very end of the whole output
+        if tree_data.get("truncated_entries", False):
+            ctx.tips_buffer.write(
+                "some entries were truncated, use '-n' to show all entries", 
+                no_color=config.no_color)
 
 
     @staticmethod
@@ -196,6 +216,8 @@ class DrawingService:
             config (Config): The application configuration
             tree_data (dict[str, Any]): The resolved tree dict to draw
         """
+        # NOTE: Only the json format needs it, other runs skip the import
+        import json
 
         def _norm(node: Any) -> Any:
             if isinstance(node, dict):
@@ -204,13 +226,14 @@ class DrawingService:
                     "self": s.as_posix() if hasattr(s, "as_posix") else str(s),
                     "children": [_norm(c) for c in node.get("children", [])],
                 }
-            return node.as_posix() if hasattr(node, "as_posix") else str(node)
+            # Files are path strings, with the native separator
+            return node.as_posix() if hasattr(node, "as_posix") else str(node).replace(os.sep, "/")
 
         ctx.output_buffer.write(json.dumps(_norm(tree_data), indent=2))
 
 
     @staticmethod
     def _is_hidden(p: str) -> bool:
-        s = p.replace("\\", "/").strip("/")
-        parts = [x for x in s.split("/") if x]
-        return any(part.startswith(".") for part in parts)
+        # Some component starts with a dot: two C-level substring scans,
+        # no splitting into a list of components
+        return "/." in "/" + p or "\\." in p
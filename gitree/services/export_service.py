@@ -5,12 +5,28 @@ Code file for housing ExportService Class
 """
 
 # Default libs
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 # Deps from this project
 from ..objects.app_context import AppContext
 from ..objects.config import Config
+from ..utilities import json_utility
+
+
+# Size of each os.read() call when reading file contents (1 MiB)
+BUF_SIZE = 1 << 20
+
+# Buffer size of the export file writer (256 KiB)
+WRITE_BUF_SIZE = 1 << 18
+
+# Text mode writes "\n" as is on this platform, so the export can be written
+# as bytes and plain ASCII file contents can skip the decode/encode round trip
+RAW_OUTPUT = os.linesep == "\n"
 
 
 class ExportService:
@@ -22,163 +38,291 @@ class ExportService:
         """
 
         fmt = (getattr(config, "format", "") or "").strip().lower()
-        output_path = Path(config.export)
 
-        if fmt == "tree":
-            lines = ExportService._export_txt(ctx, config, tree_data)
+        handler = _EXPORTERS.get(fmt)
+        if handler is None:
+            return
 
-        elif fmt == "md":
-            lines = ExportService._export_md(ctx, config, tree_data)
+        # The file write below takes raw file contents, so they are passed through
+        lines = handler(ctx, config, tree_data, raw=RAW_OUTPUT)
+        output_path = Path(config.export)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        elif fmt == "json":
-            lines = ExportService._export_json(ctx, config, tree_data)
+        # Stream the lines into a buffered writer instead of joining them first
+        if RAW_OUTPUT:
+            # Lines are str, or bytes-like file contents passed through raw
+            with open(output_path, "wb", buffering=WRITE_BUF_SIZE) as f:
+                write = f.write
+                sep = b""
+                for line in lines:
+                    write(sep)
+                    write(line.encode("utf-8") if isinstance(line, str) else line)
+                    sep = b"\n"
 
         else:
-            return
-
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text("\n".join(lines), encoding="utf-8")
+            with open(output_path, "w", encoding="utf-8", buffering=WRITE_BUF_SIZE) as f:
+                write = f.write
+                sep = ""
+                for line in lines:
+                    write(sep)
+                    write(line)
+                    sep = "\n"
 
         ctx.output_buffer.clear()
         print(f"Output saved to {output_path.absolute()}")
 
 
     @staticmethod
-    def _export_txt(ctx: AppContext, config: Config, tree_data: dict[str, Any]) -> list[str]:
-        structure = ctx.output_buffer.get_value()
-        out: list[str] = []
-
-        out.extend(structure)
+    def _export_txt(ctx: AppContext, config: Config, tree_data: dict[str, Any],
+        raw: bool = False) -> Iterator[str | memoryview]:
+        """
+        Stream the structure followed by the file contents. With raw, plain ASCII
+        contents may be yielded as memoryviews, only for writers that take bytes.
+        """
+        # Stream the buffered structure directly, no copy of the lines
+        yield from ctx.output_buffer
         
         # Skip file contents if --no-contents is enabled
         if getattr(config, "no_contents", False):
-            return out
+            return
         
-        out.append("")
-        out.append("==== FILE CONTENTS ====")
+        # Leave out the contents section entirely if there are no files
+        files = ExportService._iter_files(tree_data)
+        if not files:
+            return
 
-        for fp in ExportService._iter_files(tree_data):
-            out.append("")
-            out.append(f"FILE: {fp}")
-            out.append("-" * (6 + len(str(fp))))
-            out.append(ExportService._read_text(fp, config.max_file_size).rstrip("\n"))
+        yield ""
+        yield "==== FILE CONTENTS ===="
 
-        return out
+        contents = ExportService._read_files(files, config.max_file_size,
+            strip_newlines=True, raw=raw)
 
+        for fp, content in zip(files, contents):
+            header = f"FILE: {fp}"
+            yield ""
+            yield header
+            yield "-" * len(header)
+            yield content
 
-    @staticmethod
-    def _export_md(ctx: AppContext, config: Config, tree_data: dict[str, Any]) -> list[str]:
-        structure = ctx.output_buffer.get_value()
-        out: list[str] = []
 
-        out.append("## Project Structure")
-        out.extend(structure)       # Assuming structure is already in md format
+    @staticmethod
+    def _export_md(ctx: AppContext, config: Config, tree_data: dict[str, Any],
+        raw: bool = False) -> Iterator[str | memoryview]:
+        """
+        Stream the structure and the file contents in markdown. With raw, plain ASCII
+        contents may be yielded as memoryviews, only for writers that take bytes.
+        """
+        yield "## Project Structure"
+        yield from ctx.output_buffer       # Assuming structure is already in md format
         
         # Skip file contents if --no-contents is enabled
         if getattr(config, "no_contents", False):
-            return out
+            return
         
-        out.append("## Files")
-        out.append("")
+        # Leave out the files section entirely if there are no files
+        files = ExportService._iter_files(tree_data)
+        if not files:
+            return
 
-        for fp in ExportService._iter_files(tree_data):
-            out.append(f"### File: {fp}")
-            out.append("")
-            out.append("```text")
-            out.append(ExportService._read_text(fp, config.max_file_size).rstrip("\n"))
-            out.append("```")
-            out.append("")
+        yield "## Files"
+        yield ""
 
-        return out
+        contents = ExportService._read_files(files, config.max_file_size,
+            strip_newlines=True, raw=raw)
+
+        for fp, content in zip(files, contents):
+            yield f"### File: {fp}"
+            yield ""
+            yield "```text"
+            yield content
+            yield "```"
+            yield ""
 
 
     @staticmethod
-    def _export_json(ctx: AppContext, config: Config, tree_data: dict[str, Any]) -> list[str]:
-        import json
+    def _export_json(ctx: AppContext, config: Config, tree_data: dict[str, Any],
+        raw: bool = False) -> Iterator[str]:
+        """
+        Stream the json document piece by piece, so that only a few file contents
+        are held in memory at once. The layout matches json.dumps(payload, indent=2).
+        Contents are always escaped into str, raw is accepted for a uniform signature.
+        """
+        dumps = json_utility.dumps
 
-        structure = ctx.output_buffer.get_value()
+        # Opening brace and the structure, without the closing brace
+        head = dumps({"structure": ctx.output_buffer.get_value()}, indent=True)
+        yield head[:-2] + ","
 
         # Skip file contents if --no-contents is enabled
-        if getattr(config, "no_contents", False):
-            files = []
-        else:
-            files = [
-                {
-                    "path": str(fp),
-                    "content": ExportService._read_text(fp, config.max_file_size),
-                }
-                for fp in ExportService._iter_files(tree_data)
-            ]
+        paths = [] if getattr(config, "no_contents", False) \
+            else ExportService._iter_files(tree_data)
+
+        if not paths:
+            yield '  "files": []'
+            yield "}"
+            return
+
+        yield '  "files": ['
 
-        payload = {
-            "structure": structure,
-            "files": files,
-        }
+        last = len(paths) - 1
+        contents = ExportService._read_files(paths, config.max_file_size)
 
-        return [json.dumps(payload, indent=2, ensure_ascii=False)]
+        for i, (fp, content) in enumerate(zip(paths, contents)):
+            # Strings in json never contain a raw newline, so re-indenting is safe
+            entry = dumps({"path": fp, "content": content}, indent=True)
+            yield "    " + entry.replace("\n", "\n    ") + ("," if i < last else "")
+
+        yield "  ]"
+        yield "}"
 
 
     @staticmethod
-    def _iter_files(tree_data: Any) -> list[Path]:
+    def _iter_files(tree_data: Any) -> list[str]:
         """
-        Flatten the resolved tree dict into a list of file Paths.
+        Flatten the resolved tree dict into a list of file path strings.
 
         Args:
             tree_data (Any): A resolved tree dict with "self" and "children"
 
         Returns:
-            list[Path]: A list of file paths
+            list[str]: A list of file paths
         """
 
-        if not isinstance(tree_data, dict):
+        if not isinstance(tree_data, dict) or not tree_data.get("children"):
             return []
 
-        out: list[Path] = []
+        _isinstance, _dict, _str = isinstance, dict, str
 
-        def rec(node: dict[str, Any]) -> None:
-            for child in node.get("children", []):
-                if isinstance(child, dict):
-                    rec(child)
+        # First pass: count the files so the output list is allocated once
+        n_files = 0
+        dirs = [tree_data]
+        while dirs:
+            for child in dirs.pop().get("children", ()):
+                if _isinstance(child, _dict):
+                    dirs.append(child)
                 else:
-                    p = child if isinstance(child, Path) else Path(str(child))
-                    out.append(p)
+                    n_files += 1
+
+        out: list[str] = [None] * n_files
+        i = 0
+
+        # Second pass: stack of children iterators; descending into a dir pauses
+        # its parent iterator, which keeps files in the same depth-first order
+        stack = [iter(tree_data.get("children", ()))]
+        stack_append, stack_pop = stack.append, stack.pop
+
+        while stack:
+            for child in stack[-1]:
+                if _isinstance(child, _dict):
+                    stack_append(iter(child.get("children", ())))
+                    break
+                out[i] = _str(child)
+                i += 1
+            else:
+                stack_pop()
 
-        rec(tree_data)
         return out
 
 
     @staticmethod
-    def _read_text(path: Path, max_size_mb: float = 1.0) -> str:
+    def _read_files(files: list[str], max_size_mb: float = 1.0,
+        strip_newlines: bool = False, raw: bool = False) -> Iterator[str | memoryview]:
         """
-        Read a file as text with size limit and binary detection.
+        Read many files concurrently. Reads are I/O-bound and release the GIL,
+        so a thread pool keeps several of them in flight at once. Only a bounded
+        window of reads is queued ahead of the consumer to cap memory use.
 
         Args:
-            path (Path): The file path to read
+            files (list[str]): The file paths to read
             max_size_mb (float): Maximum file size in MB (default: 1.0)
+            strip_newlines (bool): Drop trailing newlines of each file (default: False)
+            raw (bool): Allow plain ASCII contents to be returned as bytes (default: False)
 
         Returns:
-            str: File content, or placeholder for binary/large/inaccessible files
+            Iterator[str | memoryview]: File contents, in the same order as files
+        """
+        if not files:
+            return
+
+        workers = min(32, len(files))
+        remaining = iter(files)
+
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            submit, read = ex.submit, ExportService._read_text
+            pending = deque(submit(read, fp, max_size_mb, strip_newlines, raw)
+                for fp in islice(remaining, 2 * workers))
+
+            while pending:
+                content = pending.popleft().result()
+
+                # Keep the window full before handing the content out
+                for fp in islice(remaining, 1):
+                    pending.append(submit(read, fp, max_size_mb, strip_newlines, raw))
+
+                yield content
+
+
+    @staticmethod
+    def _read_text(path: str, max_size_mb: float = 1.0, strip_newlines: bool = False,
+        raw: bool = False) -> str | memoryview:
         """
-        p = path if isinstance(path, Path) else Path(str(path))
+        Read a file as text with size limit and binary detection.
 
+        Args:
+            path (str): The file path to read
+            max_size_mb (float): Maximum file size in MB (default: 1.0)
+            strip_newlines (bool): Drop trailing newlines (default: False)
+            raw (bool): Return plain ASCII content without CR bytes as a memoryview
+                of the read bytes, which is already valid utf-8 (default: False)
+
+        Returns:
+            str | memoryview: File content, or placeholder for binary/large/inaccessible files
+        """
         try:
-            # Check file size
-            size_bytes = p.stat().st_size
-            size_mb = size_bytes / (1024 * 1024)
+            fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            try:
+                # Check file size
+                size_bytes = os.fstat(fd).st_size
+                size_mb = size_bytes / (1024 * 1024)
+
+                if size_mb > max_size_mb:
+                    return f"[file too large: {size_mb:.2f}mb]"
+
+                # Hint the kernel that we read the file front to back
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+                # Read the whole file in large chunks
+                buf = bytearray()
+                while True:
+                    chunk = os.read(fd, BUF_SIZE)
+                    if not chunk:
+                        break
+                    buf += chunk
+            finally:
+                os.close(fd)
 
-            if size_mb > max_size_mb:
-                return f"[file too large: {size_mb:.2f}mb]"
 
+            # Check if binary (first 8KB)
+            if buf.find(b'\x00', 0, 8192) != -1:  # Null byte indicates binary
+                return "[binary file]"
 
-            # Check if binary (read first 8KB)
-            with open(p, 'rb') as f:
-                chunk = f.read(min(8192, size_bytes))
-                if b'\x00' in chunk:  # Null byte indicates binary
-                    return "[binary file]"
 
+            # Trim trailing newlines on the bytes, so the text is never copied for it
+            end = len(buf)
+            if strip_newlines:
+                while end and buf[end - 1] in b"\r\n":
+                    end -= 1
 
-            # Read as text
-            return p.read_text(encoding="utf-8", errors="ignore")
+            # Nothing to decode, drop or normalize: hand the bytes out as they are
+            if raw and buf.isascii() and buf.find(b"\r", 0, end) == -1:
+                return memoryview(buf)[:end]
+
+            # Decode once, normalizing newlines like text mode does
+            text = str(memoryview(buf)[:end], "utf-8", "ignore")
+            if "\r" in text:
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+            return text
 
 
         except PermissionError:
@@ -200,3 +344,11 @@ class ExportService:
             return bool(v) and v.endswith("\n")
         except Exception:
             return False
+
+
+# Format dispatch table for ExportService.run
+_EXPORTERS = {
+    "tree": ExportService._export_txt,
+    "md": ExportService._export_md,
+    "json": ExportService._export_json,
+}
@@ -6,14 +6,9 @@ Code file for housing CopyService Class.
 Static methods; copies exported output to clipboard
 """
 
-# Dependencies
-import pyperclip
-
 # Deps from this project
 from ..objects.app_context import AppContext
 from ..objects.config import Config
-from ..services.export_service import ExportService
-from ..utilities.logging_utility import Logger
 
 
 class FlushService:
@@ -32,21 +27,21 @@ class FlushService:
             config (Config): The application configuration
         """
 
-        if not config.no_printing and not ctx.output_buffer.empty(): print()
-
+        # Evaluated once, the output buffer is not cleared while flushing
+        has_output = not config.no_printing and not ctx.output_buffer.empty()
 
         # print the export only if not in no_printing and buffer not empty
-        if not config.no_printing and not ctx.output_buffer.empty():
+        if has_output:
+            print()
             ctx.output_buffer.flush()
             ctx.tips_buffer.flush()
 
 
         # print the log if verbose mode
         if config.verbose:
-            if not config.no_printing and not ctx.output_buffer.empty():
-                print()
+            if has_output: print()
             print("LOG:")
             ctx.logger.flush()
             
 
-        if not config.no_printing and not ctx.output_buffer.empty(): print()
+        if has_output: print()
@@ -7,7 +7,6 @@ Code file for housing GeneralOptionsService.
 # Deps from this project
 from ..objects.app_context import AppContext
 from ..objects.config import Config
-from gitree import __version__
 
 
 class GeneralOptionsService:
@@ -25,12 +24,13 @@ class GeneralOptionsService:
             config (Config): config object created in main
         """
 
-        if config.config_user:
+        # NOTE: --version is handled by ParsingService before the config is built,
+        # unless --config-user is given too, which takes precedence here
+        config_user = config.config_user
+
+        if config_user:
             Config.open_config_in_editor(ctx)
             exit(0)
-        elif config.version:
-            print(__version__)
-            exit(0)
 
         # Set no_printing to True if any were handled
-        config.no_printing = config.config_user or config.version
+        config.no_printing = config_user
@@ -6,8 +6,8 @@ InteractiveSelectionService (no prompt_toolkit)
 Works on the already-resolved tree produced by ItemsSelectionService (resolved_root dict):
 {
   "self": Path,
-  "remaining_items": int,
-  "children": [Path | dict, ...],
+  "remaining_items": int (only when items were cut, defaults to 0),
+  "children": [str | Path | dict, ...] (files as path strings, dirs as dicts),
   "truncated_entries": bool (only at top currently)
 }
 
@@ -38,10 +38,14 @@ from __future__ import annotations
 import os
 import sys
 import shutil
-import re
+import select
+import signal
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Set, Tuple
-from collections import defaultdict
+from array import array
+from typing import Any, Dict, List, NamedTuple, Set, Tuple
+from functools import lru_cache
+from itertools import chain
 
 from ..objects.app_context import AppContext
 from ..objects.config import Config
@@ -52,101 +56,178 @@ CSI = "\x1b["
 # Maximum viewport height (list area only). Actual viewport clamps to terminal rows.
 VIEWPORT_LINES = 999
 
-_ANSI_RE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
-
-
-def _strip_ansi(s: str) -> str:
-    return _ANSI_RE.sub("", s)
-
-
-def _visible_len(s: str) -> int:
-    return len(_strip_ansi(s))
-
-
-def _truncate_ansi(s: str, width: int) -> str:
+# How long to wait for a key before checking for a terminal resize (seconds)
+KEY_POLL_TIMEOUT = 0.05
+
+# Pre-encoded pieces of a rendered frame
+B_CSI = CSI.encode("ascii")
+B_HIDE_CURSOR = B_CSI + b"?25l"
+B_CLEAR_SCREEN = B_CSI + b"2J" + B_CSI + b"H"   # Clear entire screen + home
+B_HOME = B_CSI + b"H"                           # Move cursor to row 1, col 1
+B_CLEAR_LINE = B_CSI + b"2K"                    # Clear entire current line
+B_CLEAR_TO_END = B_CSI + b"J"                   # Clear from cursor to end of screen
+B_INVERT = B_CSI + b"7m"
+B_DIM = B_CSI + b"2m"
+B_RESET = B_CSI + b"0m"
+B_RESET_NL = B_RESET + b"\n"
+B_VLINE = "│".encode("utf-8")
+B_IND_NONE = b" "
+B_IND_UP = "▲".encode("utf-8")
+B_IND_DOWN = "▼".encode("utf-8")
+B_IND_THUMB = "█".encode("utf-8")
+
+_CSI_PARAMS = frozenset("0123456789;?")
+
+
+def _render_row_into(buf: bytearray, s: str, width: int) -> None:
     """
-    Truncate to `width` visible characters while preserving ANSI sequences.
+    Append `s` to `buf` truncated and right-padded to exactly `width` visible
+    characters, preserving ANSI CSI sequences. Single pass, no regex.
     """
     if width <= 0:
-        return ""
+        return
 
-    out: List[str] = []
     vis = 0
     i = 0
+    seg = 0         # Start of the pending run of characters to copy
     n = len(s)
 
     while i < n and vis < width:
-        ch = s[i]
-        if ch == "\x1b":
-            # Copy CSI sequence (best-effort)
-            m = _ANSI_RE.match(s, i)
-            if m:
-                seq = m.group(0)
-                out.append(seq)
-                i = m.end()
-                continue
-            # Unknown escape; drop it to avoid infinite loops
+        if s[i] != "\x1b":
+            vis += 1
             i += 1
             continue
 
-        out.append(ch)
-        vis += 1
+        # Copy CSI sequence (best-effort): ESC [ params final-letter
+        j = i + 2
+        if s[i + 1:j] == "[":
+            while j < n and s[j] in _CSI_PARAMS:
+                j += 1
+            if j < n and s[j].isascii() and s[j].isalpha():
+                i = j + 1
+                continue
+
+        # Unknown escape; drop it to avoid infinite loops
+        buf.extend(s[seg:i].encode("utf-8"))
         i += 1
+        seg = i
+
+    buf.extend(s[seg:i].encode("utf-8"))
+    if vis < width:
+        buf.extend(b" " * (width - vis))
+
 
-    return "".join(out)
+def _ansi_show_cursor() -> str:
+    return CSI + "?25h"
+
+
+def _ansi_green(s: str) -> str:
+    return CSI + "32m" + s + CSI + "0m"
 
 
-def _pad_ansi(s: str, width: int) -> str:
+# Indent of a row keyed by depth, so all rows at one depth share a single string
+_INDENTS: List[str] = ["  " * d for d in range(128)]
+
+
+def _indent(depth: int) -> str:
+    return _INDENTS[depth] if depth < 128 else "  " * depth
+
+
+# Checkbox of a row keyed by (partial, checked); files are never partial
+_BOX_TABLE: Dict[Tuple[bool, bool], str] = {
+    (False, False): "[ ]",
+    (False, True): _ansi_green("[✓]"),
+    (True, False): "[~]",
+}
+
+
+def _write_frame(buf: bytearray) -> None:
     """
-    Right-pad to `width` visible characters. Does not trim.
+    Write a whole rendered frame to the terminal, in a single write when possible.
     """
-    pad = max(0, width - _visible_len(s))
-    return s + (" " * pad)
+    sys.stdout.flush()      # Anything still queued in the text layer goes first
 
+    if os.name == "nt":
+        # The console needs the utf-8 aware binary layer of stdout
+        sys.stdout.buffer.write(buf)
+        sys.stdout.buffer.flush()
+        return
 
-def _ansi_hide_cursor() -> str:
-    return CSI + "?25l"
+    fd = sys.stdout.fileno()
+    view = memoryview(buf)
+    while view:
+        view = view[os.write(fd, view):]
 
 
-def _ansi_show_cursor() -> str:
-    return CSI + "?25h"
+# Last known terminal size. With SIGWINCH available it is only re-read after a resize
+_cached_term_size: Tuple[int, int] | None = None
+_term_size_dirty = True
 
 
-def _ansi_invert(s: str) -> str:
-    return CSI + "7m" + s + CSI + "0m"
+def _term_size() -> Tuple[int, int]:
+    global _cached_term_size, _term_size_dirty
 
+    if _term_size_dirty or _cached_term_size is None:
+        ts = shutil.get_terminal_size(fallback=(80, 24))
+        _cached_term_size = (ts.columns, ts.lines)
 
-def _ansi_dim(s: str) -> str:
-    return CSI + "2m" + s + CSI + "0m"
+        # Without SIGWINCH there is no resize notification, so never trust the cache
+        _term_size_dirty = not hasattr(signal, "SIGWINCH")
 
+    return _cached_term_size
 
-def _ansi_green(s: str) -> str:
-    return CSI + "32m" + s + CSI + "0m"
 
+def _invalidate_term_size() -> None:
+    global _term_size_dirty
+    _term_size_dirty = True
 
-def _ansi_home() -> str:
-    # Move cursor to row 1, col 1
-    return CSI + "H"
 
+@lru_cache(maxsize=8)
+def _border(inner_w: int) -> Tuple[bytes, bytes]:
+    """
+    Encoded top and bottom box borders (with their newlines) for a given inner width.
+    """
+    return (("┌" + "─" * inner_w + "┐\n").encode("utf-8"),
+            ("└" + "─" * inner_w + "┘\n").encode("utf-8"))
 
-def _ansi_clear_screen() -> str:
-    # Clear entire screen + home
-    return CSI + "2J" + CSI + "H"
 
+@lru_cache(maxsize=None)
+def _compute_view_h(term_rows: int) -> int:
+    """
+    Ensure our whole UI block fits in the terminal to prevent scrolling.
 
-def _ansi_clear_to_end() -> str:
-    # Clear from cursor to end of screen
-    return CSI + "J"
+    We print:
+      header (1)
+      top border (1)
+      viewport lines (view_h)
+      bottom border (1)
+      footer (1)
+    => view_h + 4 total lines
 
+    Clamp view_h so (view_h + 4) <= term_rows.
+    """
+    min_rows_for_ui = 5  # gives view_h=1
+    if term_rows < min_rows_for_ui:
+        return 1
+    max_h_by_term = max(1, term_rows - 4)
+    return max(1, min(VIEWPORT_LINES, max_h_by_term))
 
-def _ansi_clear_line() -> str:
-    # Clear entire current line
-    return CSI + "2K"
 
+class _TreeData(NamedTuple):
+    """
+    Flat rows of the interactive view, stored as parallel arrays indexed by row.
+    Flags are 0/1 bytes; parents holds the parent dir row (-1 for the root).
+    """
+    is_dir: bytearray
+    checked: bytearray
+    partial: bytearray
+    parents: array
+    indents: List[str]
+    labels: List[str]
 
-def _term_size() -> Tuple[int, int]:
-    ts = shutil.get_terminal_size(fallback=(80, 24))
-    return ts.columns, ts.lines
+    @classmethod
+    def new(cls) -> "_TreeData":
+        return cls(bytearray(), bytearray(), bytearray(), array("i"), [], [])
 
 
 class _RawMode:
@@ -181,11 +262,47 @@ class _RawMode:
         return False
 
 
+# Bytes read from stdin that have not been turned into keys yet (POSIX only)
+_key_buf = bytearray()
+
+# Single-byte keys and the keys of "ESC [ <code>" sequences
+_BYTE_KEYS = {0x03: "CTRL_C", 0x0D: "ENTER", 0x0A: "ENTER", 0x20: "SPACE"}
+_ESC_KEYS = {0x41: "UP", 0x42: "DOWN"}
+
+
+def _partial_escape(buf: bytearray) -> bool:
+    """
+    Check whether buf starts with an escape sequence that is not complete yet.
+    """
+    return buf[0] == 0x1B and (len(buf) == 1 or (len(buf) == 2 and buf[1] == 0x5B))
+
+
+def _key_ready(timeout: float) -> bool:
+    """
+    Wait up to `timeout` seconds for input on stdin.
+    Returns True if a key can be read without blocking.
+    """
+    if os.name == "nt":
+        import msvcrt
+
+        if msvcrt.kbhit():
+            return True
+        time.sleep(0.01)
+        return msvcrt.kbhit()
+
+    # A whole key may already be waiting from the last read
+    if _key_buf and not _partial_escape(_key_buf):
+        return True
+
+    readable, _, _ = select.select([sys.stdin], [], [], timeout)
+    return bool(readable)
+
+
 def _read_key() -> str:
     """
     Returns normalized key names:
       'UP','DOWN','SPACE','ENTER','CTRL_C'
-    or '' if unknown.
+    or '' if unknown (or an escape sequence is still incomplete).
     """
     if os.name == "nt":
         import msvcrt
@@ -205,28 +322,32 @@ def _read_key() -> str:
             }.get(ch2, "")
         return ""
 
-    ch = sys.stdin.read(1)
-    if ch == "\x03":
-        return "CTRL_C"
-    if ch in ("\r", "\n"):
-        return "ENTER"
-    if ch == " ":
-        return "SPACE"
-    if ch != "\x1b":
+    # Read whatever is buffered straight from the fd, bypassing the sys.stdin
+    # text buffer (data hidden there would not wake up select())
+    if not _key_buf or _partial_escape(_key_buf):
+        data = os.read(sys.stdin.fileno(), 64)
+        if not data:
+            return "CTRL_C"     # stdin closed, exit with the current selection
+        _key_buf.extend(data)
+
+    first = _key_buf[0]
+    if first != 0x1B:
+        del _key_buf[0]
+        return _BYTE_KEYS.get(first, "")
+
+    # Wait for the rest of the escape sequence on the next wake-up
+    if _partial_escape(_key_buf):
         return ""
 
-    nxt = sys.stdin.read(1)
-    if nxt != "[":
+    if _key_buf[1] != 0x5B:
+        del _key_buf[:2]
         return ""
-    code = sys.stdin.read(1)
 
-    if code == "A":
-        return "UP"
-    if code == "B":
-        return "DOWN"
+    code = _key_buf[2]
+    del _key_buf[:3]
 
     # Anything else (including PgUp/PgDn sequences) is ignored.
-    return ""
+    return _ESC_KEYS.get(code, "")
 
 
 class InteractiveSelectionService:
@@ -240,9 +361,10 @@ class InteractiveSelectionService:
         if not isinstance(root_path, Path):
             root_path = Path(str(root_path))
 
-        tree: List[dict] = []
-        folder_to_files: Dict[int, List[int]] = defaultdict(list)
-        folder_to_subdirs: Dict[int, List[int]] = defaultdict(list)
+        tree = _TreeData.new()
+        folder_to_files: Dict[int, List[int]] = {}
+        folder_to_subdirs: Dict[int, List[int]] = {}
+        dir_nodes: Dict[int, Dict[str, Any]] = {}
 
         # Collect all resolved files for default selection state
         resolved_files = InteractiveSelectionService._collect_files(resolved_root)
@@ -256,64 +378,74 @@ class InteractiveSelectionService:
             folder_to_files=folder_to_files,
             folder_to_subdirs=folder_to_subdirs,
             default_checked_files=resolved_files,
+            dir_nodes=dir_nodes,
         )
 
-        if not tree:
+        n_rows = len(tree.is_dir)
+        if not n_rows:
             return resolved_root
 
-        # After tree is built, compute dir checked/partial state from descendants
-        InteractiveSelectionService._sync_dir_states(tree, folder_to_files, folder_to_subdirs)
+        # Descendant files of every dir, computed once for the whole session
+        dir_to_desc_files = InteractiveSelectionService._build_desc_files(
+            tree, folder_to_files, folder_to_subdirs)
+
+        # After tree is built, compute dir checked/partial state from descendants.
+        # Afterwards the checked counts are kept up to date incrementally.
+        dir_checked_count = InteractiveSelectionService._sync_dir_states(tree, dir_to_desc_files)
 
         cursor = 0
         scroll = 0
         first_render = True
+        frame = bytearray()
 
-        def _dir_desc_files(dir_index: int) -> List[int]:
-            acc: List[int] = []
-            acc.extend(folder_to_files.get(dir_index, []))
-            for d in folder_to_subdirs.get(dir_index, []):
-                acc.extend(_dir_desc_files(d))
-            return acc
+        # Everything a frame depends on; a render with the same key would emit the same frame
+        state_version = 0       # bumped on every selection change
+        last_frame_key: Tuple[int, ...] | None = None
+
+        # Bytes of the viewport rows and footer currently on screen, for row-level diffs
+        last_rows: List[bytes] = []
+        last_layout: Tuple[int, int] | None = None
+        last_footer = b""
+        row_buf = bytearray()
 
         def toggle_dir(index: int, state: bool) -> None:
-            # Apply state to all descendant files; dirs will be recomputed
-            for f in _dir_desc_files(index):
-                tree[f]["checked"] = state
-            InteractiveSelectionService._sync_dir_states(tree, folder_to_files, folder_to_subdirs)
+            # Apply state to all descendant files
+            changed = 0
+            checked = tree.checked
+            for f in dir_to_desc_files[index]:
+                if checked[f] != state:
+                    checked[f] = state
+                    changed += 1
+
+            if not changed:
+                return
+
+            # Every dir inside the toggled one is now fully on or fully off
+            stack = [index]
+            while stack:
+                d = stack.pop()
+                total = len(dir_to_desc_files[d])
+                dir_checked_count[d] = total if state else 0
+                InteractiveSelectionService._set_dir_state(tree, d, dir_checked_count[d], total)
+                stack.extend(folder_to_subdirs.get(d, ()))
+
+            # Dirs above it only see the difference
+            InteractiveSelectionService._update_ancestors(tree, tree.parents[index],
+                changed if state else -changed, dir_checked_count, dir_to_desc_files)
 
         def _scroll_thumb_pos(view_h: int) -> int:
             """
             Map current scroll position to a thumb row in [0, view_h-1].
             """
-            total = len(tree)
+            total = n_rows
             if total <= view_h:
                 return 0
             denom = max(1, total - view_h)
             ratio = scroll / denom
             return int(round(ratio * (view_h - 1)))
 
-        def _compute_view_h(term_rows: int) -> int:
-            """
-            Ensure our whole UI block fits in the terminal to prevent scrolling.
-
-            We print:
-              header (1)
-              top border (1)
-              viewport lines (view_h)
-              bottom border (1)
-              footer (1)
-            => view_h + 4 total lines
-
-            Clamp view_h so (view_h + 4) <= term_rows.
-            """
-            min_rows_for_ui = 5  # gives view_h=1
-            if term_rows < min_rows_for_ui:
-                return 1
-            max_h_by_term = max(1, term_rows - 4)
-            return max(1, min(VIEWPORT_LINES, max_h_by_term))
-
         def render() -> None:
-            nonlocal scroll, first_render
+            nonlocal scroll, first_render, last_frame_key, last_layout, last_footer
 
             cols, rows = _term_size()
 
@@ -325,16 +457,18 @@ class InteractiveSelectionService:
             if cursor >= scroll + view_h:
                 scroll = cursor - view_h + 1
 
+            # Nothing visible changed (e.g. UP on the first row), skip the redraw
+            frame_key = (cursor, scroll, cols, rows, state_version)
+            if frame_key == last_frame_key:
+                return
+            last_frame_key = frame_key
+
             start = scroll
-            end = min(len(tree), scroll + view_h)
+            end = min(n_rows, scroll + view_h)
 
-            selected_count = 0
-            total_files = 0
-            for it in tree:
-                if it["type"] == "file":
-                    total_files += 1
-                    if it["checked"]:
-                        selected_count += 1
+            # Every file is below the root row, so its counts cover the whole tree
+            selected_count = dir_checked_count[0]
+            total_files = len(dir_to_desc_files[0])
 
             header = "↑/↓ Move | Space Toggle | Enter Confirm | Ctrl+C Exit"
             header = header[:cols]
@@ -349,97 +483,168 @@ class InteractiveSelectionService:
             indicator_w = 1
             content_w = max(0, inner_w - indicator_w)
 
-            can_scroll = len(tree) > view_h
+            can_scroll = n_rows > view_h
             thumb = _scroll_thumb_pos(view_h) if can_scroll else -1
 
-            # Re-render in place:
-            # - On first render: clear screen + home
-            # - Thereafter: just home + overwrite the same block, clearing each line.
-            if first_render:
-                sys.stdout.write(_ansi_hide_cursor())
-                sys.stdout.write(_ansi_clear_screen())
-                first_render = False
-            else:
-                sys.stdout.write(_ansi_home())
-
-            # HEADER
-            sys.stdout.write(_ansi_clear_line())
-            sys.stdout.write(_ansi_dim(header) + "\n")
-
-            # TOP BORDER
-            sys.stdout.write(_ansi_clear_line())
-            sys.stdout.write("┌" + ("─" * inner_w) + "┐" + "\n")
-
-            # VIEWPORT LINES (always exactly view_h lines)
+            # The whole frame is built in one reusable byte buffer and written at once
+            buf = frame
+            buf.clear()
+            put = buf.extend
+
+            # Rows are diffed against the last frame; a new layout invalidates them all
+            layout = (cols, view_h)
+            full = first_render or layout != last_layout
+            if full:
+                last_rows[:] = [b""] * view_h
+                last_layout = layout
+
+            # Locals for the row loop, each one saves a global/attribute lookup per row
+            indents, labels = tree.indents, tree.labels
+            partial, checked = tree.partial, tree.checked
+            box_table, render_row_into = _BOX_TABLE, _render_row_into
+            row_put = row_buf.extend
+            blank = b" " * content_w
+
+            # VIEWPORT LINES (always exactly view_h lines), built here and emitted below
+            rows_out: List[bytes | None] = []
+            out_append = rows_out.append
             for row in range(view_h):
                 idx = start + row
 
                 # Determine scroll indicator char for this row
-                ind = " "
+                ind = B_IND_NONE
                 if can_scroll:
                     if row == 0 and scroll > 0:
-                        ind = "▲"
-                    elif row == view_h - 1 and end < len(tree):
-                        ind = "▼"
+                        ind = B_IND_UP
+                    elif row == view_h - 1 and end < n_rows:
+                        ind = B_IND_DOWN
                     elif row == thumb:
-                        ind = "█"
+                        ind = B_IND_THUMB
                     else:
-                        ind = "│"
+                        ind = B_VLINE
 
-                sys.stdout.write(_ansi_clear_line())
+                row_buf.clear()
+                row_put(B_VLINE)
                 if idx < end:
-                    item = tree[idx]
-                    indent = "  " * item["depth"]
-                    name = item["name"]
+                    line = indents[idx] + box_table[partial[idx], checked[idx]] + labels[idx]
 
-                    if item["type"] == "dir":
-                        if item.get("partial"):
-                            box = "[~]"
-                        else:
-                            box = "[✓]" if item["checked"] else "[ ]"
+                    # Fit into content_w visible columns while preserving ANSI.
+                    # Highlight cursor row (invert only the content area, not borders)
+                    if idx == cursor:
+                        row_put(B_INVERT)
+                        render_row_into(row_buf, line, content_w)
+                        row_put(B_RESET)
                     else:
-                        box = "[✓]" if item["checked"] else "[ ]"
+                        render_row_into(row_buf, line, content_w)
+                else:
+                    # Past end of tree: blank content area to fully overwrite old content
+                    row_put(blank)
+                row_put(ind)
+                row_put(B_VLINE)
 
-                    box = _ansi_green(box) if (not item.get("partial") and item["checked"]) else box
-                    line = f"{indent}{box} {name}"
+                # Unchanged rows are left alone on the screen (None)
+                if row_buf == last_rows[row]:
+                    out_append(None)
+                else:
+                    row_bytes = last_rows[row] = bytes(row_buf)
+                    out_append(row_bytes)
+
+            footer_bytes = B_DIM + footer.encode("utf-8") + B_RESET
+
+            if not full:
+                # Move to each changed row and rewrite only that row
+                for row, row_bytes in enumerate(rows_out):
+                    if row_bytes is not None:
+                        put(B_CSI + b"%d;1H" % (row + 3))     # header + top border come first
+                        put(B_CLEAR_LINE)
+                        put(row_bytes)
+
+                if footer_bytes != last_footer:
+                    put(B_CSI + b"%d;1H" % (view_h + 4))
+                    put(B_CLEAR_LINE)
+                    put(footer_bytes)
+
+                last_footer = footer_bytes
+                if buf:
+                    _write_frame(buf)
+                return
+
+            # Full redraw:
+            # - On first render: clear screen + home
+            # - Thereafter: just home + overwrite the same block, clearing each line.
+            if first_render:
+                put(B_HIDE_CURSOR)
+                put(B_CLEAR_SCREEN)
+                first_render = False
+            else:
+                put(B_HOME)
 
-                    # Fit into content_w visible columns while preserving ANSI
-                    line = _truncate_ansi(line, content_w)
-                    line = _pad_ansi(line, content_w)
+            # HEADER
+            put(B_CLEAR_LINE)
+            put(B_DIM)
+            put(header.encode("utf-8"))
+            put(B_RESET_NL)
 
-                    # Highlight cursor row (invert only the content area, not borders)
-                    if idx == cursor:
-                        line = _ansi_invert(line)
+            top_border, bottom_border = _border(inner_w)
 
-                    sys.stdout.write("│" + line + ind + "│" + "\n")
-                else:
-                    # Past end of tree: blank content area to fully overwrite old content
-                    blank = " " * content_w
-                    sys.stdout.write("│" + blank + ind + "│" + "\n")
+            # TOP BORDER
+            put(B_CLEAR_LINE)
+            put(top_border)
+
+            for row_bytes in rows_out:
+                put(B_CLEAR_LINE)
+                put(row_bytes)
+                put(b"\n")
 
             # BOTTOM BORDER
-            sys.stdout.write(_ansi_clear_line())
-            sys.stdout.write("└" + ("─" * inner_w) + "┘" + "\n")
+            put(B_CLEAR_LINE)
+            put(bottom_border)
 
             # FOOTER (NO trailing newline to reduce accidental scroll on tight terminals)
-            sys.stdout.write(_ansi_clear_line())
-            sys.stdout.write(_ansi_dim(footer))
+            put(B_CLEAR_LINE)
+            put(footer_bytes)
+            last_footer = footer_bytes
 
             # Clear anything below our block (so resizing / prior prints don't linger)
-            sys.stdout.write(_ansi_clear_to_end())
-            sys.stdout.flush()
+            put(B_CLEAR_TO_END)
+            _write_frame(buf)
 
         def finalize() -> Dict[str, Any]:
-            selected_files: Set[Path] = set()
-            for item in tree:
-                if item["type"] == "file" and item["checked"]:
-                    selected_files.add(item["abs_path"])
-            return InteractiveSelectionService._filter_resolved_root_keep_meta(resolved_root, selected_files)
+            return InteractiveSelectionService._filter_resolved_root_keep_meta(
+                resolved_root, tree, dir_nodes, folder_to_files, folder_to_subdirs, dir_checked_count)
+
+        # Re-render on terminal resize (POSIX only), the handler only raises a flag
+        resized = False
+
+        def _on_resize(signum, frame) -> None:
+            nonlocal resized
+            resized = True
+            _invalidate_term_size()
+
+        _invalidate_term_size()     # Size may have changed since any earlier session
+        sigwinch = getattr(signal, "SIGWINCH", None)
+        old_handler = signal.signal(sigwinch, _on_resize) if sigwinch is not None else None
 
         try:
             with _RawMode():
                 render()
+
+                # Keys only update the state and mark the frame dirty. The frame is drawn
+                # once no more input is pending, so a burst of keys (e.g. a held arrow key)
+                # collapses into a single render of the latest state instead of a backlog.
+                dirty = False
                 while True:
+                    if dirty and not _key_ready(0):
+                        dirty = False
+                        render()
+
+                    # Wake up periodically instead of blocking, so a resize is noticed
+                    if not _key_ready(KEY_POLL_TIMEOUT):
+                        if resized:
+                            resized = False
+                            render()
+                        continue
+
                     k = _read_key()
                     if not k:
                         continue
@@ -452,28 +657,33 @@ class InteractiveSelectionService:
 
                     if k == "UP":
                         cursor = max(0, cursor - 1)
-                        render()
+                        dirty = True
                         continue
 
                     if k == "DOWN":
-                        cursor = min(len(tree) - 1, cursor + 1)
-                        render()
+                        cursor = min(n_rows - 1, cursor + 1)
+                        dirty = True
                         continue
 
                     if k == "SPACE":
-                        item = tree[cursor]
-                        if item["type"] == "dir":
+                        if tree.is_dir[cursor]:
                             # If partial or unchecked => turn ON, else turn OFF
-                            if item.get("partial") or not item["checked"]:
+                            if tree.partial[cursor] or not tree.checked[cursor]:
                                 toggle_dir(cursor, True)
                             else:
                                 toggle_dir(cursor, False)
                         else:
-                            item["checked"] = not item["checked"]
-                            InteractiveSelectionService._sync_dir_states(tree, folder_to_files, folder_to_subdirs)
-                        render()
+                            state = not tree.checked[cursor]
+                            tree.checked[cursor] = state
+                            InteractiveSelectionService._update_ancestors(tree, tree.parents[cursor],
+                                1 if state else -1, dir_checked_count, dir_to_desc_files)
+                        state_version += 1
+                        dirty = True
                         continue
         finally:
+            if sigwinch is not None:
+                signal.signal(sigwinch, old_handler)
+
             # Restore terminal visuals and leave it in a clean state.
             sys.stdout.write(_ansi_show_cursor())
             sys.stdout.write(CSI + "0m")
@@ -485,15 +695,17 @@ class InteractiveSelectionService:
     def _collect_files(resolved_node: Dict[str, Any]) -> Set[Path]:
         out: Set[Path] = set()
 
-        def walk(node: Dict[str, Any]) -> None:
-            for ch in node.get("children", []):
+        # Iterative walk, the files of each dir are added to the set in one update()
+        stack = [resolved_node]
+        while stack:
+            paths: List[Path] = []
+            for ch in stack.pop().get("children", ()):
                 if isinstance(ch, dict):
-                    walk(ch)
+                    stack.append(ch)
                 else:
-                    p = ch if isinstance(ch, Path) else Path(str(ch))
-                    out.add(p)
+                    paths.append(ch if isinstance(ch, Path) else Path(str(ch)))
+            out.update(paths)
 
-        walk(resolved_node)
         return out
 
     @staticmethod
@@ -501,136 +713,190 @@ class InteractiveSelectionService:
         resolved_node: Dict[str, Any],
         root: Path,
         depth: int,
-        tree: List[dict],
+        tree: _TreeData,
         folder_to_files: Dict[int, List[int]],
         folder_to_subdirs: Dict[int, List[int]],
         default_checked_files: Set[Path],
+        dir_nodes: Dict[int, Dict[str, Any]],
+        parent_dir_index: int = -1,
     ) -> None:
-        dir_path = resolved_node.get("self")
-        if not isinstance(dir_path, Path):
-            dir_path = Path(str(dir_path))
-
-        folder_index = len(tree)
-        rel_dir = dir_path.relative_to(root).as_posix() or "(root)"
-        name = rel_dir.split("/")[-1] + ("/" if rel_dir != "(root)" else "")
-
-        tree.append({
-            "type": "dir",
-            "abs_path": dir_path,
-            "name": name if rel_dir != "(root)" else "(root)/",
-            "depth": depth,
-            "checked": False,   # computed later
-            "partial": False,   # computed later
-        })
-
-        children = resolved_node.get("children", [])
-        for child in children:
-            if not isinstance(child, dict):
-                continue
+        """
+        Flatten the resolved tree into rows: each dir, then its subdirs (recursively),
+        then its own files. Iterative with an explicit stack, one pass over children.
+        dir_nodes maps each dir row back to its resolved dict.
+        """
+        # Stack of open dirs: (folder_index, depth, children iterator, files seen so far)
+        stack: List[Tuple[int, int, Any, List[Any]]] = []
+        is_dir, checked, partial, parents = tree.is_dir, tree.checked, tree.partial, tree.parents
+        indents, labels = tree.indents, tree.labels
+
+        def open_dir(node: Dict[str, Any], node_depth: int, parent_index: int) -> None:
+            dir_path = node.get("self")
+            if not isinstance(dir_path, Path):
+                dir_path = Path(str(dir_path))
+
+            name = (dir_path.name if dir_path != root else ".") + "/"
+            folder_index = len(is_dir)
+            dir_nodes[folder_index] = node
+
+            is_dir.append(1)
+            checked.append(0)       # computed later
+            partial.append(0)       # computed later
+            parents.append(parent_index)
+            indents.append(_indent(node_depth))
+            labels.append(" " + name)
+            stack.append((folder_index, node_depth, iter(node.get("children", ())), []))
+
+        open_dir(resolved_node, depth, parent_dir_index)
+
+        while stack:
+            folder_index, node_depth, children, files = stack[-1]
+
+            for child in children:
+                if isinstance(child, dict):
+                    # Descend now; this dir's remaining children continue afterwards
+                    folder_to_subdirs.setdefault(folder_index, []).append(len(is_dir))
+                    open_dir(child, node_depth + 1, folder_index)
+                    break
+                files.append(child)
 
-            child_index = len(tree)
-            folder_to_subdirs[folder_index].append(child_index)
-            InteractiveSelectionService._build_tree_from_resolved(
-                resolved_node=child,
-                root=root,
-                depth=depth + 1,
-                tree=tree,
-                folder_to_files=folder_to_files,
-                folder_to_subdirs=folder_to_subdirs,
-                default_checked_files=default_checked_files,
-            )
-
-        for child in children:
-            if isinstance(child, dict):
-                continue
-            
-            child_path = child if isinstance(child, Path) else Path(str(child))
-            rel_path = child_path.relative_to(root).as_posix()
-            file_index = len(tree)
-
-            tree.append({
-                "type": "file",
-                "abs_path": child_path,
-                "name": rel_path.split("/")[-1],
-                "depth": depth + 1,
-                "checked": (child_path in default_checked_files),
-            })
-            folder_to_files[folder_index].append(file_index)
+            else:
+                # All subdirs are placed, the dir's own files come after them
+                stack.pop()
+                if not files:
+                    continue
+
+                file_indices = folder_to_files.setdefault(folder_index, [])
+                file_indent = _indent(node_depth + 1)
+                for child in files:
+                    child_path = child if isinstance(child, Path) else Path(str(child))
+                    file_indices.append(len(is_dir))
+
+                    is_dir.append(0)
+                    checked.append(child_path in default_checked_files)
+                    partial.append(0)       # files are never partial
+                    parents.append(folder_index)
+                    indents.append(file_indent)
+                    labels.append(" " + child_path.name)
 
     @staticmethod
-    def _sync_dir_states(
-        tree: List[dict],
+    def _build_desc_files(
+        tree: _TreeData,
         folder_to_files: Dict[int, List[int]],
         folder_to_subdirs: Dict[int, List[int]],
+    ) -> Dict[int, List[int]]:
+        """
+        Map every dir index to the indices of all its descendant files.
+        Dirs are stored in preorder, so walking them in reverse fills in
+        every subdir before its parent (one bottom-up pass, no recursion).
+        """
+        dir_to_desc_files: Dict[int, List[int]] = {}
+
+        dir_indices = [i for i, d in enumerate(tree.is_dir) if d]
+        for i in reversed(dir_indices):
+            dir_to_desc_files[i] = folder_to_files.get(i, []) + list(chain.from_iterable(
+                dir_to_desc_files[d] for d in folder_to_subdirs.get(i, [])))
+
+        return dir_to_desc_files
+
+    @staticmethod
+    def _sync_dir_states(
+        tree: _TreeData,
+        dir_to_desc_files: Dict[int, List[int]],
+    ) -> Dict[int, int]:
+        """
+        Compute dir checked/partial based on descendant files.
+        Returns the number of checked descendant files per dir.
+        """
+        dir_checked_count: Dict[int, int] = {}
+
+        is_checked = tree.checked.__getitem__
+        set_dir_state = InteractiveSelectionService._set_dir_state
+        for i, files in dir_to_desc_files.items():
+            checked = sum(map(is_checked, files))
+            dir_checked_count[i] = checked
+            set_dir_state(tree, i, checked, len(files))
+
+        return dir_checked_count
+
+    @staticmethod
+    def _update_ancestors(
+        tree: _TreeData,
+        dir_index: int,
+        delta: int,
+        dir_checked_count: Dict[int, int],
+        dir_to_desc_files: Dict[int, List[int]],
     ) -> None:
         """
-        Recompute dir checked/partial based on descendant files.
+        Add delta to the checked count of dir_index and every dir above it,
+        refreshing their checked/partial state. O(depth) per toggle.
+        """
+        while dir_index >= 0:
+            dir_checked_count[dir_index] += delta
+            InteractiveSelectionService._set_dir_state(tree, dir_index,
+                dir_checked_count[dir_index], len(dir_to_desc_files[dir_index]))
+            dir_index = tree.parents[dir_index]
+
+    @staticmethod
+    def _set_dir_state(tree: _TreeData, index: int, checked: int, total: int) -> None:
+        """
+        Set dir checked/partial from its checked and total descendant files.
         - checked=True only if ALL descendant files are checked and at least one exists
         - partial=True if SOME but not all descendant files are checked
         - unchecked if none checked
         """
-        sys.setrecursionlimit(max(2000, sys.getrecursionlimit()))
-
-        def desc_files(dir_index: int) -> List[int]:
-            acc: List[int] = []
-            acc.extend(folder_to_files.get(dir_index, []))
-            for d in folder_to_subdirs.get(dir_index, []):
-                acc.extend(desc_files(d))
-            return acc
-
-        # dirs are stored in tree in preorder; compute from bottom up for efficiency
-        dir_indices = [i for i, it in enumerate(tree) if it["type"] == "dir"]
-        for i in reversed(dir_indices):
-            files = desc_files(i)
-            if not files:
-                tree[i]["checked"] = False
-                tree[i]["partial"] = False
-                continue
-            checked = sum(1 for f in files if tree[f]["checked"])
-            if checked == 0:
-                tree[i]["checked"] = False
-                tree[i]["partial"] = False
-            elif checked == len(files):
-                tree[i]["checked"] = True
-                tree[i]["partial"] = False
-            else:
-                tree[i]["checked"] = False
-                tree[i]["partial"] = True
+        tree.checked[index] = total > 0 and checked == total
+        tree.partial[index] = 0 < checked < total
 
     @staticmethod
-    def _filter_resolved_root_keep_meta(resolved_root: Dict[str, Any], selected_files: Set[Path]) -> Dict[str, Any]:
+    def _filter_resolved_root_keep_meta(
+        resolved_root: Dict[str, Any],
+        tree: _TreeData,
+        dir_nodes: Dict[int, Dict[str, Any]],
+        folder_to_files: Dict[int, List[int]],
+        folder_to_subdirs: Dict[int, List[int]],
+        dir_checked_count: Dict[int, int],
+    ) -> Dict[str, Any]:
         """
         Filter resolved_root to keep only selected file Paths and dirs that contain them.
         Preserves per-node 'remaining_items' if present.
         Preserves top-level 'truncated_entries' if present.
+
+        Dirs are filtered bottom up (reverse preorder), so every subdir is ready before
+        its parent. Dirs without checked files are skipped without being visited.
         """
+        filtered: Dict[int, Dict[str, Any]] = {}
 
-        def filt(node: Dict[str, Any]) -> Dict[str, Any]:
+        for i in reversed(dir_nodes):
+            if not dir_checked_count[i] and i != 0:
+                continue        # Nothing selected below; the root is always kept
+
+            node = dir_nodes[i]
             node_self = node.get("self")
             if not isinstance(node_self, Path):
                 node_self = Path(str(node_self))
 
-            node_remaining = node.get("remaining_items", 0)
+            # Subdirs and files keep their relative order in both index lists,
+            # so they can be matched up with the original children in one pass
+            subdirs = iter(folder_to_subdirs.get(i, ()))
+            files = iter(folder_to_files.get(i, ()))
 
             new_children: List[Any] = []
             for ch in node.get("children", []):
                 if isinstance(ch, dict):
-                    fc = filt(ch)
-                    if fc.get("children"):
+                    fc = filtered.get(next(subdirs))
+                    if fc is not None:
                         new_children.append(fc)
-                else:
-                    p = ch if isinstance(ch, Path) else Path(str(ch))
-                    if p in selected_files:
-                        new_children.append(ch)
+                elif tree.checked[next(files)]:
+                    new_children.append(ch)
 
-            out = {
+            filtered[i] = {
                 "self": node_self,
-                "remaining_items": node_remaining,
+                "remaining_items": node.get("remaining_items", 0),
                 "children": new_children,
             }
-            return out
 
-        out_root = filt(resolved_root)
+        out_root = filtered[0]
         if "truncated_entries" in resolved_root:
             out_root["truncated_entries"] = resolved_root["truncated_entries"]
         return out_root
@@ -5,6 +5,11 @@ Optimized iterative directory traversal with stack-based approach.
 """
 
 # Default libs
+import os
+from bisect import bisect_left
+from concurrent.futures import Future, ThreadPoolExecutor
+from math import inf
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List
 import time
@@ -12,14 +17,33 @@ import time
 # Deps from this project
 from ...objects.app_context import AppContext
 from ...objects.config import Config
-from ...objects.gitignore import GitIgnore
 from ...utilities.gitignore_utility import GitIgnoreMatcher
 from ...utilities.logging_utility import Logger
 from .filter_applier import FilterApplier
 from .path_resolver import PathResolver
+from .path_trie import PathTrie
 from .performance_cache import PerformanceCache
 
 
+# Dirs with more subdirs than this get their subdirs listed ahead in the thread pool
+PREFETCH_MIN_DIRS = 4
+
+# Dirs above this depth get their subdirs listed ahead however few there are. The
+# top levels (src, tests, docs, ...) hold the biggest subtrees, listing them in
+# parallel early gives the pool work for the rest of the walk
+PREFETCH_ALL_DEPTH = 2
+
+
+# Listed child: (is_dir, lowercased name, name, is_symlink). The Path of a child is
+# only built in the traversal, once the cheap name-based filters let it through.
+Child = tuple[bool, str, str, bool]
+
+# Order of listed children: files first (False sorts before True), then by name.
+# The lowercased name is computed once per child in the listing, and itemgetter
+# builds the key in C, without a Python-level call per child.
+_sort_key = itemgetter(0, 1)
+
+
 class DirectoryTraverser:
     """
     Optimized directory traversal using iterative stack-based approach.
@@ -49,6 +73,7 @@ class DirectoryTraverser:
                 root_dir: Path,
                 resolved_include_paths: List[Path],
                 exclude_paths: List[Path],
+                given_paths: List[Path],
                 gitignore_matcher: GitIgnoreMatcher,
                 start_time: float) -> Dict[str, Any]:
         """
@@ -58,6 +83,7 @@ class DirectoryTraverser:
             root_dir: Root directory to start traversal from
             resolved_include_paths: Paths to include
             exclude_paths: Paths to exclude
+            given_paths: Resolved non-glob paths given by user
             gitignore_matcher: GitIgnore matcher instance
             start_time: Start time for performance logging
             
@@ -69,9 +95,9 @@ class DirectoryTraverser:
         total_entries = 0
         truncated_entries = False
         
-        # Stack item: (dir_path, depth, parent_result_dict)
-        # We use a stack to simulate recursion iteratively
-        stack: List[tuple[Path, int, Dict[str, Any]]] = []
+        # Stack item: (dir_path, depth, parent_result_dict, prefetched listing or None,
+        # dir_path has no symlink in it). We use a stack to simulate recursion iteratively
+        stack: List[tuple[Path, int, Dict[str, Any], Future | None, bool]] = []
         
         # Initialize root result
         root_result = {
@@ -81,143 +107,213 @@ class DirectoryTraverser:
             "truncated_entries": False
         }
         
-        # Start with root directory
-        stack.append((root_dir, 0, root_result))
+        # Start with root directory, resolved by the PathResolver
+        stack.append((root_dir, 0, root_result, None, True))
         
-        # Track processed directories to avoid duplicate processing
-        processed: set[str] = set()
+        # OPTIMIZATION: Snapshot everything that is constant for the whole traversal,
+        # so the per-child loop only touches locals
+        config = self.config
+        entry_limit = inf if config.no_max_entries else config.max_entries
+        item_limit = inf if config.no_max_items else config.max_items
+        max_depth = inf if config.no_max_depth else config.max_depth
+        no_files = config.no_files
+        exclude_depth = config.exclude_depth
+        gitignore_depth = config.gitignore_depth
+        ext_set = self.filter_applier.file_extensions_set if config.file_extensions else None
+        skip_dir_names = frozenset(()) if config.hidden_items else frozenset(config.always_skip_dirs)
+
+        # The log is only printed in verbose mode, so only then pay for the per-dir message
+        verbose = config.verbose
+        now = time.time
+
+        # Tries turn the "is under any of these paths" checks into O(depth) lookups
+        include_trie = PathTrie(resolved_include_paths)
+        exclude_trie = PathTrie(exclude_paths)
+        given_trie = PathTrie(given_paths)
+
+        # Filter specialized on the config once, for the whole traversal
+        include_item = self.filter_applier.make_item_filter(
+            gitignore_matcher, exclude_trie, include_trie, root_dir)
         
-        while stack:
-            curr_dir, curr_depth, result_dict = stack.pop()
+        # Listing directories is I/O that releases the GIL, so the subdirs of wide
+        # dirs are listed ahead in a pool while the filters run here. Filtering stays
+        # in this one thread, in the same order, so the output is deterministic.
+        # NOTE: Threads are only started on the first submit
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as pool:
+            while stack:
+                # NOTE: Every directory is pushed exactly once, by the single listing of
+                # its parent, so popped directories need no duplicate check
+                curr_dir, curr_depth, result_dict, listing, dir_is_real = stack.pop()
             
-            # Skip if already processed (can happen with certain path structures)
-            dir_key = str(curr_dir)
-            if dir_key in processed:
-                continue
-            processed.add(dir_key)
+                if verbose:
+                    self.ctx.logger.log(Logger.DEBUG, 
+                        "Processing %s at: %s ms", curr_dir.name, round((now()-start_time)*1000, 2))
             
-            self.ctx.logger.log(Logger.DEBUG, 
-                f"Processing {curr_dir.name} at: {round((time.time()-start_time)*1000, 2)} ms")
+                # Check depth limit
+                if curr_depth >= max_depth:
+                    continue
             
-            # Check depth limit
-            if self.filter_applier.check_depth_limit(curr_depth):
-                continue
+                # Determine if directory is under given paths
+                dir_under_given_paths = given_trie.covers(curr_dir)
             
-            # Determine if directory is under given paths
-            dir_under_given_paths = self._is_dir_under_given_paths(curr_dir)
+                # Filter flags shared by all children, hoisted out of the per-child loop.
+                # Exclude paths can only cover children of this directory if one of them
+                # is this directory, above it or under it. Checked once here, so the
+                # directories off every exclude path skip the per-child lookups.
+                dir_has_excludes = (curr_depth <= exclude_depth and bool(exclude_trie) and (
+                    exclude_trie.has_under(curr_dir) or exclude_trie.covers(curr_dir)))
+                dir_in_gitignore_depth = curr_depth <= gitignore_depth
             
-            # Get sorted children (files first, then alphabetically)
-            # OPTIMIZATION: Avoid lambda overhead, use list comprehension + sort
-            try:
-                children = list(curr_dir.iterdir())
-                # Sort in place: files first (is_dir=False sorts before True), then by name
-                children.sort(key=lambda p: (self.perf_cache.is_dir_cached(p), p.name.lower()))
-            except (PermissionError, OSError):
-                continue
+                # Get sorted children (files first, then alphabetically)
+                try:
+                    children = (listing.result() if listing is not None
+                        else DirectoryTraverser._list_dir(curr_dir))
+                except (PermissionError, OSError):
+                    continue
             
-            # Check for .gitignore in current directory
-            gitignore_path = curr_dir / ".gitignore"
-            if (curr_depth <= self.config.gitignore_depth and 
-                self.perf_cache.exists_cached(gitignore_path)):
-                # Create a new GitIgnore and add to matcher
-                new_gitignore = GitIgnore(self.ctx, self.config, gitignore_path)
-                gitignore_matcher.add_gitignore(new_gitignore, curr_dir)
-
-                # Add tip if gitignores found but not used
-                if not self.config.gitignore and not self.gitignore_tip_added: 
-                    self.ctx.tips_buffer.write(
-                        "gitignore files were found, use '-g' to apply .gitignore rules")
-                    self.gitignore_tip_added = True
+                # Check for .gitignore in current directory, from the listing (no stat)
+                if dir_in_gitignore_depth and self._has_gitignore(children):
+                    # Load the GitIgnore (compiled once per directory) into the matcher
+                    gitignore_matcher.load_gitignore(self.ctx, self.config, curr_dir)
+
+                    # Add tip if gitignores found but not used
+                    if not self.config.gitignore and not self.gitignore_tip_added: 
+                        self.ctx.tips_buffer.write(
+                            "gitignore files were found, use '-g' to apply .gitignore rules")
+                        self.gitignore_tip_added = True
             
-            items_added = 0
+                items_added = 0
+                # The children list of this directory, its append bound once for the loop
+                add_child = result_dict["children"].append
+                # Files are stored as path strings, joined onto this prefix
+                dir_prefix = str(curr_dir)
+                if not dir_prefix.endswith(os.sep):
+                    dir_prefix += os.sep
+                new_dirs: List[tuple[Path, int, Dict[str, Any], Future | None, bool]] = []
             
-            # OPTIMIZATION: When using file_extensions filter, we can batch-filter
-            # all non-matching files before detailed checks
-            if self.config.file_extensions:
-                file_extensions_set = self.filter_applier.file_extensions_set
-                filtered_children = []
-                for item_path in children:
-                    is_dir = self.perf_cache.is_dir_cached(item_path)
-                    if is_dir:
-                        # Always include directories for traversal
-                        filtered_children.append((item_path, is_dir))
-                    else:
-                        # Check extension quickly
-                        name = item_path.name
-                        dot_idx = name.rfind('.')
-                        if dot_idx > 0:
-                            file_ext = name[dot_idx + 1:].lower()
-                            if file_ext in file_extensions_set:
-                                filtered_children.append((item_path, is_dir))
-                children = filtered_children
-            else:
-                # Add is_dir flag to avoid recalculation
-                children = [(p, self.perf_cache.is_dir_cached(p)) for p in children]
+                # OPTIMIZATION: When using file_extensions filter, we can batch-filter
+                # all non-matching files before detailed checks
+                if ext_set is not None:
+                    # Always include directories for traversal, check the last file
+                    # extension (lowercased) with one set lookup
+                    children = [child for child in children
+                        if child[0] or ((dot_idx := child[2].rfind('.')) > 0 and 
+                            child[2][dot_idx + 1:].lower() in ext_set)]
             
-            # Process children
-            for item_path, is_dir in children:
-                # Check entry limit (global)
-                if self.filter_applier.check_entry_limit(total_entries):
-                    truncated_entries = True
-                    break
+                # Process children
+                for is_dir, _, name, is_link in children:
+                    # Check entry limit (global)
+                    if total_entries >= entry_limit:
+                        truncated_entries = True
+                        break
                 
-                # Check item limit (per directory)
-                if self.filter_applier.check_item_limit(items_added):
-                    result_dict["remaining_items"] = len(children) - items_added
-                    break
+                    # Check item limit (per directory)
+                    if items_added >= item_limit:
+                        result_dict["remaining_items"] = len(children) - items_added
+                        break
                 
-                # is_dir already computed above, no need to recalculate
+                    # Fast rejects with plain locals, before the full filter chain
+                    if not is_dir and no_files:
+                        continue
                 
-                # Apply all filters
-                if not self.filter_applier.should_include_item(
-                    item_path=item_path,
-                    curr_depth=curr_depth,
-                    is_dir=is_dir,
-                    gitignore_matcher=gitignore_matcher,
-                    exclude_paths=exclude_paths,
-                    resolved_include_paths=resolved_include_paths,
-                    dir_under_given_paths=dir_under_given_paths
-                ):
-                    continue
+                    # Well-known tool/dependency dirs are skipped by name in O(1), unless
+                    # something under them was included explicitly
+                    if (is_dir and name in skip_dir_names and 
+                        not include_trie.has_under(curr_dir / name)):
+                        continue
                 
-                # Item passed all filters
-                items_added += 1
-                total_entries += 1
+                    # Dirs always need their Path (tree node, stack), files only get
+                    # one from the filter if a path-based filter applies to them
+                    item_path = curr_dir / name if is_dir else None
                 
-                if is_dir:
-                    # Create result dict for subdirectory
-                    subdir_result = {
-                        "self": item_path,
-                        "remaining_items": 0,
-                        "children": []
-                    }
-                    result_dict["children"].append(subdir_result)
+                    # A path with no symlink anywhere under the resolved root is already
+                    # its own resolved path, so the gitignore check needs no resolve()
+                    is_real = dir_is_real and not is_link
+
+                    # Apply all filters
+                    if not include_item(curr_dir, name, is_dir, dir_under_given_paths,
+                        dir_has_excludes, dir_in_gitignore_depth, is_real, item_path):
+                        continue
+                
+                    # Item passed all filters
+                    items_added += 1
+                    total_entries += 1
+                
+                    if is_dir:
+                        # Create result dict for subdirectory; "remaining_items" is only
+                        # added when items get cut, readers default it to 0
+                        subdir_result = {
+                            "self": item_path,
+                            "children": []
+                        }
+                        add_child(subdir_result)
                     
-                    # Add to stack for processing (with incremented depth)
-                    stack.append((item_path, curr_depth + 1, subdir_result))
-                else:
-                    # Add file directly
-                    result_dict["children"].append(item_path)
+                        # Add to stack for processing (with incremented depth)
+                        new_dirs.append((item_path, curr_depth + 1, subdir_result, None, is_real))
+                    else:
+                        # Add file directly, as its path string: building a Path per
+                        # file costs more than the rest of the loop, and every reader
+                        # of the tree takes file entries as str or Path
+                        add_child(dir_prefix + name)
+                
+                # Prefetch the listings of wide dirs and of all dirs near the root, unless
+                # the subdirs are past max depth or the entry limit is already reached
+                # (then at most one more listing is needed, to tell if entries were cut)
+                if ((len(new_dirs) > PREFETCH_MIN_DIRS or 
+                     (curr_depth < PREFETCH_ALL_DEPTH and len(new_dirs) > 1)) and 
+                    curr_depth + 1 < max_depth and total_entries < entry_limit):
+                    new_dirs = [(path, depth, result, pool.submit(DirectoryTraverser._list_dir, path), real)
+                        for path, depth, result, _, real in new_dirs]
+                stack.extend(new_dirs)
+                
+                # Once the entry limit is hit, every directory still on the stack would
+                # only be listed to add nothing, so the walk ends here
+                if truncated_entries:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    break
         
         # Set truncation flag on root
         root_result["truncated_entries"] = truncated_entries
         
         return root_result
     
-    def _is_dir_under_given_paths(self, dir_path: Path) -> bool:
+    @staticmethod
+    def _list_dir(dir_path: Path) -> List[Child]:
+        """
+        List a directory, sorted with files first, then alphabetically.
+        scandir entries carry the file type from the directory listing itself,
+        so there is no stat() per child for is_dir or is_symlink.
+        
+        Args:
+            dir_path: Directory to list
+            
+        Returns:
+            List of (is_dir, lowercased name, name, is_symlink) for each child
+        """
+        with os.scandir(dir_path) as it:
+            children = [(e.is_dir(), e.name.lower(), e.name, e.is_symlink()) for e in it]
+        
+        children.sort(key=_sort_key)
+        return children
+    
+    @staticmethod
+    def _has_gitignore(children: List[Child]) -> bool:
         """
-        Check if directory path was explicitly given by user.
+        Check if a sorted directory listing contains a .gitignore file.
         
         Args:
-            dir_path: Directory path to check
+            children: Listed children, sorted with _sort_key
             
         Returns:
-            True if path was given by user
+            True if a file named .gitignore is in the listing
         """
-        given_paths: List[Path] = []
+        target = (False, ".gitignore")
+        i = bisect_left(children, target, key=_sort_key)
         
-        for path_str in self.config.paths:
-            if not self.path_resolver._is_glob(path_str):
-                given_paths.append(Path(path_str).resolve(strict=False))
+        # Names differing only in case share the sort key, check each of them
+        while i < len(children) and _sort_key(children[i]) == target:
+            if children[i][2] == ".gitignore":
+                return True
+            i += 1
         
-        return self.path_resolver.is_under(dir_path, given_paths)
+        return False
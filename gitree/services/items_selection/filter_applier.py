@@ -6,13 +6,14 @@ Filter application logic for items selection.
 
 # Default libs
 from pathlib import Path
-from typing import List
+from typing import Callable, Optional
 
 # Deps from this project
 from ...objects.app_context import AppContext
 from ...objects.config import Config
 from ...utilities.gitignore_utility import GitIgnoreMatcher
 from .path_resolver import PathResolver
+from .path_trie import PathTrie
 
 
 class FilterApplier:
@@ -33,94 +34,118 @@ class FilterApplier:
         # Preprocess file extensions for fast lookup
         self.file_extensions_set = None
         if self.config.file_extensions:
-            # Use a set for O(1) lookups, normalize to lowercase
-            self.file_extensions_set = {ext.lower().lstrip('.') for ext in self.config.file_extensions}
+            # Use a set for O(1) lookups. The extensions are already lowercased and
+            # stripped of the dot by SemanticProcessingService, which always sets them
+            self.file_extensions_set = set(self.config.file_extensions)
             self.ctx.logger.log(self.ctx.logger.DEBUG,
-                               f"FilterApplier: Initialized with extensions: {self.file_extensions_set}")
-    
-    def should_include_item(self, 
-                           item_path: Path,
-                           curr_depth: int,
-                           is_dir: bool,
-                           gitignore_matcher: GitIgnoreMatcher,
-                           exclude_paths: List[Path],
-                           resolved_include_paths: List[Path],
-                           dir_under_given_paths: bool) -> bool:
+                               "FilterApplier: Initialized with extensions: %s", self.file_extensions_set)
+
+
+    def make_item_filter(self,
+                         gitignore_matcher: GitIgnoreMatcher,
+                         exclude_trie: PathTrie,
+                         include_trie: PathTrie,
+                         root_dir: Path) -> Callable[..., bool]:
         """
-        Determine if an item should be included based on all filters.
-        
+        Build the item filter for one traversal, specialized on the config.
+
+        Every config flag is constant for the whole traversal, so it is evaluated
+        once here: filters that cannot reject anything (no --exclude, no -g, ...)
+        are left out of the returned function instead of being rechecked per item.
+        All filters only reject, so they run cheapest first and stop at the first reject.
+
         Args:
-            item_path: Path to check
-            curr_depth: Current traversal depth
-            is_dir: Whether the path is a directory
             gitignore_matcher: GitIgnore matcher instance
-            exclude_paths: List of excluded paths
-            resolved_include_paths: List of included paths
-            dir_under_given_paths: Whether parent dir is in given paths
-            
+            exclude_trie: Trie of the excluded paths
+            include_trie: Trie of the included paths
+            root_dir: Root directory of the traversal, every item is under it
+
         Returns:
-            True if item should be included, False otherwise
+            A function (dir_path, name, is_dir, dir_under_given_paths, dir_has_excludes,
+            dir_in_gitignore_depth, resolved, item_path) returning True if the item
+            should be included. The dir_* flags are the same for all items of a directory
+            and computed once per directory by the caller: dir_has_excludes tells if an
+            exclude path can cover items of the directory (within --exclude-depth),
+            dir_in_gitignore_depth if it is within --gitignore-depth. item_path is the
+            Path of the item if the caller has it already, otherwise it is only built
+            (dir_path / name) when one of the path-based filters applies to the item.
         """
-        
-        # Filter 1: Skip files if --no-files is used
-        if not is_dir and self.config.no_files:
-            return False
-        
-        # Filter 1.5: File extension filtering (OPTIMIZED - happens early)
-        # Only check files, not directories
-        if not is_dir and self.file_extensions_set:
-            # Get file extension efficiently using string operations
-            # This is faster than Path.suffix for hot paths
-            name = item_path.name
-            dot_idx = name.rfind('.')
-            if dot_idx > 0:  # Ensure dot is not at the start (hidden files)
-                file_ext = name[dot_idx + 1:].lower()
-                if file_ext not in self.file_extensions_set:
+        config = self.config
+        no_files = config.no_files
+        ext_set = self.file_extensions_set or None
+        check_hidden = not config.hidden_items
+        # GitIgnore.excluded() never rejects without -g, skip the matcher entirely
+        check_gitignore = config.gitignore
+        gitignore_excluded = gitignore_matcher.excluded
+        # OPTIMIZATION: Skip the include checks if using file_extensions filtering
+        # because we're scanning the whole tree and the extension check already
+        # filtered files
+        check_include = ext_set is None
+        exclude_covers = exclude_trie.covers
+        include_covers, include_has_under = include_trie.covers, include_trie.has_under
+        # Every traversed item is under the root, so when the root itself is covered
+        # (it is one of the include paths, as their common parent) no item can fail
+        # the include paths filter and it is left out
+        check_include_covers = check_include and not include_covers(root_dir)
+
+        def include_item(dir_path: Path, name: str, is_dir: bool,
+                         dir_under_given_paths: bool, dir_has_excludes: bool,
+                         dir_in_gitignore_depth: bool, resolved: bool = False,
+                         item_path: Optional[Path] = None) -> bool:
+            if not is_dir:
+                # Filter 1: Skip files if --no-files is used
+                if no_files:
                     return False
-            else:
-                # No extension, so not in allowed extensions
-                return False
-        
-        # Filter 2: Handle paths not explicitly given
-        # OPTIMIZATION: Skip this check if using file_extensions filtering
-        # because we're scanning the whole tree and filtering by extension
-        if not dir_under_given_paths and not self.file_extensions_set:
-            # Skip files not in resolved paths
-            if not is_dir and item_path not in resolved_include_paths:
+
+                # Filter 1.5: File extension filtering, the last extension lowercased
+                # and looked up in the set. A leading dot alone (hidden file like
+                # ".py") is not an extension.
+                if ext_set is not None:
+                    dot_idx = name.rfind('.')
+                    if dot_idx <= 0 or name[dot_idx + 1:].lower() not in ext_set:
+                        return False
+
+            # Filters 2 to 6 below are the path-based ones, most items pass without
+            # any of them applying, and then no Path is built for the item at all
+            if item_path is None:
+                if not ((check_hidden and name.startswith(".")) or dir_has_excludes or
+                    (check_include and (not dir_under_given_paths or check_include_covers)) or
+                    (check_gitignore and dir_in_gitignore_depth)):
+                    return True
+                item_path = dir_path / name
+
+            # Filter 2: Hidden items filter, a string prefix check on the name first
+            if (check_hidden and name.startswith(".") and 
+                item_path not in include_trie):
                 return False
-            
-            # Skip dirs with no included files under them
-            # NOTE: This check is expensive but necessary for correctness
-            if is_dir and not any(
-                self.path_resolver.is_under(t, [item_path]) 
-                for t in resolved_include_paths
-            ):
+
+            # Filter 3: Exclude paths filter (within depth)
+            if dir_has_excludes and exclude_covers(item_path):
                 return False
-        
-        # Filter 3: Hidden items filter
-        if (not self.config.hidden_items and 
-            self.path_resolver.is_hidden(item_path) and 
-            item_path not in resolved_include_paths):
-            return False
-        
-        # Filter 4: Exclude paths filter (within depth)
-        if (curr_depth <= self.config.exclude_depth and 
-            self.path_resolver.is_under(item_path, exclude_paths)):
-            return False
-        
-        # Filter 5: Gitignore filter (within depth)
-        if (curr_depth <= self.config.gitignore_depth and 
-            gitignore_matcher.excluded(item_path)):
-            return False
-        
-        # Filter 6: Include paths filter
-        # OPTIMIZATION: Skip this check if using file_extensions filtering
-        # because the extension check already filtered files
-        if not self.file_extensions_set:
-            if not self.path_resolver.is_under(item_path, resolved_include_paths):
+
+            if check_include:
+                # Filter 4: Handle paths not explicitly given
+                if not dir_under_given_paths:
+                    # Skip files not in resolved paths
+                    if not is_dir and item_path not in include_trie:
+                        return False
+
+                    # Skip dirs with no included files under them
+                    if is_dir and not include_has_under(item_path):
+                        return False
+
+                # Filter 5: Include paths filter
+                if check_include_covers and not include_covers(item_path):
+                    return False
+
+            # Filter 6: Gitignore filter (within depth), the most expensive one goes last
+            if (check_gitignore and dir_in_gitignore_depth and 
+                gitignore_excluded(item_path, is_dir, resolved)):
                 return False
-        
-        return True
+
+            return True
+
+        return include_item
     
     def check_depth_limit(self, curr_depth: int) -> bool:
         """
@@ -49,7 +49,7 @@ class ItemsSelectionService:
         """
 
         ctx.logger.log(Logger.DEBUG, 
-            f"Entered ItemsSelectionService at: {round((time.time()-start_time)*1000, 2)} ms")
+            "Entered ItemsSelectionService at: %s ms", round((time.time()-start_time)*1000, 2))
 
         # Initialize components
         path_resolver = PathResolver(ctx, config)
@@ -60,15 +60,16 @@ class ItemsSelectionService:
         resolved_include_paths = path_resolver.resolve_paths(
             config.paths + config.include)
         ctx.logger.log(Logger.DEBUG, 
-            f"Selected includes at: {round((time.time()-start_time)*1000, 2)} ms")
+            "Selected includes at: %s ms", round((time.time()-start_time)*1000, 2))
 
         # Print root path
         ctx.output_buffer.write(f"    Root: {resolved_include_paths[-1]}\n")
 
-        # Resolve exclude paths
-        resolved_exclude_paths = path_resolver.resolve_paths(config.exclude)
+        # Resolve exclude paths (without the common parent), nothing to do without --exclude
+        resolved_exclude_paths = (path_resolver.resolve_paths(config.exclude)[:-1]
+            if config.exclude else [])
         ctx.logger.log(Logger.DEBUG, 
-            f"Selected excludes at: {round((time.time()-start_time)*1000, 2)} ms")
+            "Selected excludes at: %s ms", round((time.time()-start_time)*1000, 2))
 
         # Safety check
         if not resolved_include_paths:
@@ -82,12 +83,13 @@ class ItemsSelectionService:
         resolved_items = directory_traverser.traverse(
             root_dir=resolved_include_paths[-1],
             resolved_include_paths=resolved_include_paths,
-            exclude_paths=resolved_exclude_paths[:-1],
+            exclude_paths=resolved_exclude_paths,
+            given_paths=path_resolver.resolve_given_paths(config.paths),
             gitignore_matcher=gitignore_matcher,
             start_time=start_time
         )
 
         ctx.logger.log(Logger.DEBUG, 
-            f"Exited ItemsSelectionService at: {round((time.time()-start_time)*1000, 2)} ms")
+            "Exited ItemsSelectionService at: %s ms", round((time.time()-start_time)*1000, 2))
 
         return resolved_items
@@ -7,6 +7,7 @@ Path resolution and glob pattern handling with caching.
 # Default libs
 import os
 import glob
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
@@ -14,7 +15,31 @@ from typing import List
 from ...objects.app_context import AppContext
 from ...objects.config import Config
 from ...utilities.logging_utility import Logger
-from ...utilities.functions_utility import error_and_exit
+from ...utilities.functions_utility import error_and_exit, is_under_str
+
+
+# Characters that make a path argument a glob pattern
+_GLOB_CHARS = frozenset("*?[")
+
+# Resolved paths interned by their string, so the same path given in the include,
+# exclude and common parent lists is one shared Path object (built and hashed once)
+_PATH_INTERN: dict[str, Path] = {}
+
+
+def _intern_path(path_str: str) -> Path:
+    """
+    Get the shared Path object for a resolved path string.
+
+    Args:
+        path_str: Resolved path string
+
+    Returns:
+        Path: The interned Path for that string
+    """
+    path = _PATH_INTERN.get(path_str)
+    if path is None:
+        path = _PATH_INTERN[path_str] = Path(path_str)
+    return path
 
 
 class PathResolver:
@@ -38,6 +63,9 @@ class PathResolver:
         
         # Cache for glob pattern results
         self._glob_cache: dict[str, List[Path]] = {}
+        
+        # Real paths by path string, ancestors included, see _realpath()
+        self._real_paths: dict[str, str] = {}
     
     def resolve_paths(self, path_strings: list[str]) -> list[Path]:
         """
@@ -67,7 +95,7 @@ class PathResolver:
         # Add common parent at the end
         if calculated_paths:
             try:
-                common_parent = Path(os.path.commonpath(calculated_paths))
+                common_parent = _intern_path(os.path.commonpath(calculated_paths))
                 calculated_paths.append(common_parent)
             except ValueError as e:
                 print(e)
@@ -75,6 +103,20 @@ class PathResolver:
         
         return calculated_paths
     
+    def resolve_given_paths(self, path_strings: list[str]) -> list[Path]:
+        """
+        Resolve the non-glob paths among the given path strings. Paths already
+        resolved by resolve_paths() come straight from the cache.
+        
+        Args:
+            path_strings: List of path strings (may include glob patterns)
+            
+        Returns:
+            List of resolved Path objects, without globs and common parent
+        """
+        return [self._resolve_single_path(path_str)
+            for path_str in path_strings if not self._is_glob(path_str)]
+    
     def _resolve_single_path(self, path_str: str) -> Path:
         """
         Resolve a single path string to a Path object with caching.
@@ -95,7 +137,7 @@ class PathResolver:
         if not path.exists():
             error_and_exit(f"Given value for path does not exist: {path}")
         
-        resolved_path = (self.base_path / path).resolve(strict=False)
+        resolved_path = _intern_path(self._realpath(os.path.join(self.base_path, path_str)))
         
         # Cache the result
         self._resolved_cache[path_str] = resolved_path
@@ -116,26 +158,56 @@ class PathResolver:
         if pattern in self._glob_cache:
             return self._glob_cache[pattern]
         
-        # Resolve glob pattern
-        matched_paths = glob.glob(pattern, recursive=True, include_hidden=True)
+        # Resolve glob pattern, streaming the matches instead of building the match
+        # list first. Matches share their parents, which _realpath() resolves once.
+        realpath = self._realpath
+        result = [_intern_path(realpath(match))
+            for match in glob.iglob(pattern, recursive=True, include_hidden=True)]
         
-        if not matched_paths:
+        if not result:
             self.ctx.logger.log(Logger.WARNING, 
                 f"No matches found for glob pattern '{pattern}'")
             return []
         
-        # Convert to Path objects
-        result = [Path(p).resolve(strict=False) for p in matched_paths]
-        
         # Cache the result
         self._glob_cache[pattern] = result
         
         return result
     
+    def _realpath(self, path_str: str) -> str:
+        """
+        os.path.realpath() (what Path.resolve() runs) with every ancestor cached.
+
+        realpath() lstat()s each component of the path. Here a path only costs one
+        lstat() on top of its resolved parent, and the parent is resolved the same
+        way, so paths sharing ancestors (CLI paths under the same repo, glob matches
+        in the same directory) resolve each ancestor once.
+
+        Args:
+            path_str: Path string to resolve, relative to the cwd if not absolute
+            
+        Returns:
+            The resolved path string, same as os.path.realpath(path_str)
+        """
+        real = self._real_paths.get(path_str)
+        if real is not None:
+            return real
+        
+        parent, name = os.path.split(path_str)
+        if name in ("", ".", "..") or os.path.islink(path_str):
+            # Roots, dot components and symlinks are left to realpath() itself
+            real = os.path.realpath(path_str)
+        else:
+            real = os.path.join(self._realpath(parent), name)
+        
+        self._real_paths[path_str] = real
+        return real
+    
     @staticmethod
+    @lru_cache(maxsize=None)
     def _is_glob(path_str: str) -> bool:
-        """Check if a string contains glob pattern characters."""
-        return any(c in path_str for c in "*?[")
+        """Check if a string contains glob pattern characters (cached, CLI strings repeat)."""
+        return not _GLOB_CHARS.isdisjoint(path_str)
     
     @staticmethod
     def is_under(path: Path, parents: list[Path]) -> bool:
@@ -149,7 +221,18 @@ class PathResolver:
         Returns:
             True if path is under any parent
         """
-        return any(path == p or path.is_relative_to(p) for p in parents)
+        # Interned paths make the exact match an identity check, no string compare.
+        # Plain loops with early exits, parents lists are short and a generator
+        # in any() costs a frame resume per parent
+        for p in parents:
+            if path is p:
+                return True
+
+        path_str = str(path)
+        for p in parents:
+            if is_under_str(path_str, str(p)):
+                return True
+        return False
     
     @staticmethod
     def is_hidden(path: Path) -> bool:
@@ -0,0 +1,105 @@
+# gitree/services/items_selection/path_trie.py
+
+"""
+Prefix trie over path components, for fast "is under" checks.
+"""
+
+# Default libs
+import os
+from pathlib import Path
+from typing import Iterable
+
+
+# Marks a node where one of the stored paths ends
+_END = None
+
+# Paths compare case-insensitively on Windows, the same as PathResolver.is_under()
+_NORMCASE = str.lower if os.name == "nt" else None
+
+
+class PathTrie:
+    """
+    Trie of stored paths keyed by their components.
+
+    Replaces linear PathResolver.is_under() scans over a list of paths: a lookup
+    walks the components of the queried path once, so it costs O(depth) no matter
+    how many paths are stored.
+    """
+
+    def __init__(self, paths: Iterable[Path]):
+        self._root: dict = {}
+
+        # Exact matches are a plain hash lookup, no walk needed
+        self._paths: frozenset[Path] = frozenset(paths)
+
+        for path in self._paths:
+            node = self._root
+            for part in PathTrie._parts(path):
+                node = node.setdefault(part, {})
+            node[_END] = True
+
+
+    def covers(self, path: Path) -> bool:
+        """
+        Check if a path is one of the stored paths or under any of them.
+
+        Args:
+            path: Path to check
+
+        Returns:
+            True if path is under (or equal to) a stored path
+        """
+        node = self._root
+        if _END in node:
+            return True
+
+        for part in PathTrie._parts(path):
+            node = node.get(part)
+            if node is None:
+                return False
+            if _END in node:
+                return True
+
+        return False
+
+
+    def has_under(self, path: Path) -> bool:
+        """
+        Check if any of the stored paths is the path itself or under it.
+
+        Args:
+            path: Path to check
+
+        Returns:
+            True if a stored path is under (or equal to) path
+        """
+        node = self._root
+        for part in PathTrie._parts(path):
+            node = node.get(part)
+            if node is None:
+                return False
+
+        return bool(node)
+
+
+    def __bool__(self) -> bool:
+        """
+        Check if any path is stored at all.
+        """
+        return bool(self._paths)
+
+
+    def __contains__(self, path: Path) -> bool:
+        """
+        Check if the path is exactly one of the stored paths, in O(1).
+        """
+        return path in self._paths
+
+
+    @staticmethod
+    def _parts(path: Path) -> Iterable[str]:
+        """
+        Components of a path, case-folded where the platform compares paths so.
+        """
+        parts = path.parts
+        return parts if _NORMCASE is None else map(_NORMCASE, parts)
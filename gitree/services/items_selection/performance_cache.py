@@ -9,6 +9,9 @@ from pathlib import Path
 from typing import Optional, Set
 from functools import lru_cache
 
+# Deps from this project
+from ...utilities.functions_utility import is_under_str
+
 
 class PerformanceCache:
     """
@@ -131,11 +134,8 @@ class PerformanceCache:
         if cache_key in self._is_under_cache:
             return self._is_under_cache[cache_key]
         
-        # Check if paths are equal or child is relative to parent
-        try:
-            result = (child == parent) or (child.is_relative_to(parent))
-        except (ValueError, AttributeError):
-            result = False
+        # Check if paths are equal or child is relative to parent (string prefix check)
+        result = is_under_str(*cache_key)
         
         # Cache with limit
         if len(self._is_under_cache) < self.max_cache_size:
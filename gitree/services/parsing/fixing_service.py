@@ -14,6 +14,10 @@ from ...objects.app_context import AppContext
 from ...objects.config import Config
 
 
+# Export file extension for each --format, used when the export path has none
+_DEFAULT_EXPORT_EXTS = {"tree": ".txt", "json": ".json", "md": ".md"}
+
+
 class FixingService:
     """
     Service responsible for correcting and validating parsed arguments.
@@ -33,18 +37,21 @@ class FixingService:
             Corrected arguments namespace
         """
         
+        # Flags default to argparse.SUPPRESS, a given flag is a key in the namespace dict
+        opts = vars(args)
+        
         # Correcting export path
-        if getattr(args, "export", None) is not None:
+        if opts.get("export") is not None:
             args.export = FixingService._fix_output_path(
                 ctx, args.export,
-                default_extensions={"tree": ".txt", "json": ".json", "md": ".md"},
+                default_extensions=_DEFAULT_EXPORT_EXTS,
                 format_str=args.format)
             
         # Correcting zip path
-        if getattr(args, "zip", None):
+        if opts.get("zip"):
             args.zip = FixingService._fix_output_path(ctx, args.zip, default_extension=".zip")
 
-        ctx.logger.log(ctx.logger.DEBUG, f"Corrected arguments: {args}")
+        ctx.logger.log(ctx.logger.DEBUG, "Corrected arguments: %s", args)
         return args
     
 
@@ -93,10 +100,12 @@ class FixingService:
         Returns:
             Fixed configuration object
         """
+        # Nothing can overlap unless both lists are given, the usual case
+        if not config.include or not config.exclude:
+            return config
+
         # Remove intersecting values for include and exclude patterns
-        include_set = set(config.include)
-        exclude_set = set(config.exclude)
-        common_values = include_set & exclude_set
+        common_values = set(config.include).intersection(config.exclude)
 
         if common_values:
             ctx.logger.log(
@@ -104,7 +113,8 @@ class FixingService:
                 "--include and --exclude patterns have overlapping values. "
                 "These values will be removed from both lists"
             )
-            config.include = list(include_set - common_values)
-            config.exclude = list(exclude_set - common_values)
+            # One pass per list, keeping the order the patterns were given in
+            config.include = [p for p in config.include if p not in common_values]
+            config.exclude = [p for p in config.exclude if p not in common_values]
 
         return config
@@ -10,7 +10,7 @@ import sys
 from pathlib import Path
 
 # Imports from this project
-from ...utilities.functions_utility import max_items_int, max_entries_int
+from gitree import __version__
 from ...objects.config import Config
 from ...objects.app_context import AppContext
 from .rich_help_formatter import RichHelpFormatter
@@ -18,6 +18,14 @@ from .fixing_service import FixingService
 from .semantic_processing_service import SemanticProcessingService
 
 
+# Flags answered before the parser is built
+_HELP_FLAGS = frozenset(("-h", "--help"))
+_VERSION_FLAGS = frozenset(("-v", "--version"))
+
+# The parser is the same for every run, it is built once and reused
+_PARSER_SINGLETON: "CustomArgumentParser | None" = None
+
+
 class CustomArgumentParser(argparse.ArgumentParser):
     """Custom ArgumentParser that shows concise error messages instead of full help."""
     
@@ -43,27 +51,28 @@ class ParsingService:
             Config: Configuration object to be used in-place of args
         """
         
+        # One pass over argv, then every early flag check is a set lookup
+        argv_set = frozenset(sys.argv[1:])
+        
         # Handle help flag early before argparse processes it
-        if '-h' in sys.argv or '--help' in sys.argv:
+        if not argv_set.isdisjoint(_HELP_FLAGS):
             formatter = RichHelpFormatter('gt')
             formatter.format_help()
 
-        ap = CustomArgumentParser(
-            prog='gt',
-            description="Print a directory tree (does not respect .gitignore by default).",
-            formatter_class=RichHelpFormatter,
-            add_help=False  # Disable default help to use our custom one
-        )
-
-        ParsingService._add_positional_args(ctx, ap)
-        ParsingService._add_general_options(ctx, ap)
-        ParsingService._add_io_flags(ctx, ap)
-        ParsingService._add_listing_flags(ctx, ap)
-        ParsingService._add_listing_control_flags(ctx, ap)
-        ParsingService._add_semantic_flags(ctx, ap)
-
-        args = ap.parse_args()
-        ctx.logger.log(ctx.logger.DEBUG, f"Parsed arguments: {args}")
+        # Handle version flag early as well, printing it needs no parser at all.
+        # --config-user still goes first, see GeneralOptionsService
+        if not argv_set.isdisjoint(_VERSION_FLAGS) and "--config-user" not in argv_set:
+            print(__version__)
+            sys.exit(0)
+
+        # Only paths given (or nothing, the most common run): the namespace argparse
+        # would return is known without building the parser
+        argv = sys.argv[1:]
+        if not any(arg.startswith("-") for arg in argv):
+            args = argparse.Namespace(paths=argv or ["."], format="tree")
+        else:
+            args = ParsingService._build_parser(ctx).parse_args(argv)
+        ctx.logger.log(ctx.logger.DEBUG, "Parsed arguments: %s", args)
 
         # Process semantic flags first (e.g., --full, --no-limit, --only-types)
         args = SemanticProcessingService.process_semantic_flags(ctx, args)
@@ -80,6 +89,36 @@ class ParsingService:
         # Fix any contradicting arguments
         return FixingService.fix_contradicting_args(ctx, config)
 
+    @staticmethod
+    def _build_parser(ctx: AppContext) -> CustomArgumentParser:
+        """
+        Get the argument parser with all the flag groups, built on first use.
+
+        Returns:
+            CustomArgumentParser: The parser for the gitree CLI
+        """
+        global _PARSER_SINGLETON
+        if _PARSER_SINGLETON is not None:
+            return _PARSER_SINGLETON
+        
+        ap = CustomArgumentParser(
+            prog='gt',
+            description="Print a directory tree (does not respect .gitignore by default).",
+            formatter_class=RichHelpFormatter,
+            add_help=False  # Disable default help to use our custom one
+        )
+
+        ParsingService._add_positional_args(ctx, ap)
+        ParsingService._add_general_options(ctx, ap)
+        ParsingService._add_io_flags(ctx, ap)
+        ParsingService._add_listing_flags(ctx, ap)
+        ParsingService._add_listing_control_flags(ctx, ap)
+        ParsingService._add_semantic_flags(ctx, ap)
+        
+        _PARSER_SINGLETON = ap
+        return ap
+
+
     @staticmethod
     def _add_positional_args(ctx: AppContext, ap: argparse.ArgumentParser):
         ap.add_argument(
@@ -135,6 +174,9 @@ class ParsingService:
 
     @staticmethod
     def _add_listing_flags(ctx: AppContext, ap: argparse.ArgumentParser):
+        # NOTE: Only needed as type= validators here, imported when the parser is built
+        from ...utilities.functions_utility import max_items_int, max_entries_int
+        
         listing = ap.add_argument_group("listing options")
 
         listing.add_argument("--format", "--fmt", choices=["tree", "json", "md"], 
@@ -159,7 +201,8 @@ class ParsingService:
         listing.add_argument("-a", "--hidden-items", "--all",
             action="store_true",
             default=argparse.SUPPRESS,
-            help="Show hidden files and directories")
+            help="Show hidden files and directories, and the dirs skipped by default"
+                " (always_skip_dirs: node_modules, venv, build, dist, target, ...)")
 
         listing.add_argument("--exclude", nargs="*", 
             default=argparse.SUPPRESS, help="Patterns of files to specifically exclude")
@@ -7,14 +7,91 @@ Provides beautiful, color-coded help output using the Rich library.
 
 # Default libs
 import argparse
+import hashlib
+import os
+import shutil
 import sys
+from pathlib import Path
+from typing import Optional
 
-# Dependencies
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-from rich import box
+# Deps from this project
+from gitree import __version__
+
+# NOTE: Rich is imported inside the methods that render with it, argparse builds
+# this formatter for every run (usage, errors) but the Rich output is only needed
+# for --help, so other runs skip the whole Rich import graph
+
+
+# ASCII-art title printed at the top of the help
+_BANNER = """
+     ██████╗ ██╗████████╗██████╗ ███████╗███████╗
+    ██╔════╝ ██║╚══██╔══╝██╔══██╗██╔════╝██╔════╝
+    ██║  ███╗██║   ██║   ██████╔╝█████╗  █████╗
+    ██║   ██║██║   ██║   ██╔══██╗██╔══╝  ██╔══╝
+    ╚██████╔╝██║   ██║   ██║  ██║███████╗███████╗
+     ╚═════╝ ╚═╝   ╚═╝   ╚═╝  ╚═╝╚══════╝╚══════╝
+            """
+
+# Environment variables that change how Rich renders the help
+_RENDER_ENV_VARS = ("TERM", "COLORTERM", "NO_COLOR", "FORCE_COLOR", "TTY_COMPATIBLE")
+
+# Set to a non-empty value to always render the help, without reading or writing the cache
+_NO_CACHE_ENV_VAR = "GITREE_NO_HELP_CACHE"
+
+
+def _help_cache_path() -> Optional[Path]:
+    """
+    Path of the rendered help cache for the current terminal.
+
+    The help text is static, so its rendering only depends on the version, this
+    file, the terminal width, whether stdout is a terminal and the color env vars.
+    All of these are part of the file name, a change simply renders a new file
+    (and the stale one is pruned, see _write_help_cache()).
+
+    Returns:
+        Optional[Path]: The cache file path, None where the help is not cached
+    """
+    # Rich drives legacy Windows consoles through the win32 API, not plain ANSI text
+    if sys.platform == "win32" or os.environ.get(_NO_CACHE_ENV_VAR):
+        return None
+
+    try:
+        key = repr((
+            __version__,
+            os.stat(__file__).st_mtime_ns,
+            shutil.get_terminal_size().columns,
+            sys.stdout.isatty(),
+            tuple(os.environ.get(var) for var in _RENDER_ENV_VARS),
+        ))
+    except (OSError, ValueError):
+        return None
+
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return Path(cache_dir) / "gitree" / f"help-{digest}.ansi"
+
+
+def _write_help_cache(cache_path: Path, rendered: str) -> None:
+    """
+    Write the rendered help to the cache, replacing the renderings cached for
+    other versions, terminal widths or env vars, so only one file is kept.
+    A failed write only loses the cache.
+
+    Args:
+        cache_path (Path): The cache file path, from _help_cache_path()
+        rendered (str): The rendered help text
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(rendered, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+
+        for stale_path in cache_path.parent.glob("help-*.ansi"):
+            if stale_path != cache_path:
+                stale_path.unlink(missing_ok=True)
+    except OSError:
+        pass
 
 
 class RichHelpFormatter(argparse.HelpFormatter):
@@ -24,49 +101,70 @@ class RichHelpFormatter(argparse.HelpFormatter):
 
     def __init__(self, prog):
         super().__init__(prog, max_help_position=40, width=100)
-        self.console = Console()
+        self._console = None
+
+    @property
+    def console(self):
+        """The Rich console, only created on first use."""
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console()
+        return self._console
 
     def format_help(self):
         """Override to create a fully Rich-formatted help display."""
-        self.console.print()
-        
-        # Header with tool name and description
-        self._print_header()
-        
-        # Usage section
-        self._print_usage()
-        
-        # Positional arguments
-        self._print_positional_args()
+        # The help is static, print the rendering cached by an earlier run if any,
+        # which skips importing Rich and rendering altogether
+        cache_path = _help_cache_path()
+        if cache_path is not None:
+            try:
+                sys.stdout.write(cache_path.read_text(encoding="utf-8"))
+                sys.exit(0)
+            except OSError:
+                pass
+
+        with self.console.capture() as capture:
+            self.console.print()
+            
+            # Header with tool name and description
+            self._print_header()
+            
+            # Usage section
+            self._print_usage()
+            
+            # Positional arguments
+            self._print_positional_args()
+            
+            # Options sections - Only show General and Semantic options
+            self._print_general_options()
+            self._print_semantic_flags()
         
-        # Options sections - Only show General and Semantic options
-        self._print_general_options()
-        self._print_semantic_flags()
+        rendered = capture.get()
+        sys.stdout.write(rendered)
+
+        # Cache the rendering for the next runs
+        if cache_path is not None:
+            _write_help_cache(cache_path, rendered)
         
         # Exit after displaying help
         sys.exit(0)
 
     def _print_header(self):
         """Print the main header with tool name and description."""
-        title = Text("""
-     ██████╗ ██╗████████╗██████╗ ███████╗███████╗
-    ██╔════╝ ██║╚══██╔══╝██╔══██╗██╔════╝██╔════╝
-    ██║  ███╗██║   ██║   ██████╔╝█████╗  █████╗
-    ██║   ██║██║   ██║   ██╔══██╗██╔══╝  ██╔══╝
-    ╚██████╔╝██║   ██║   ██║  ██║███████╗███████╗
-     ╚═════╝ ╚═╝   ╚═╝   ╚═╝  ╚═╝╚══════╝╚══════╝
-            """, style="blue")
-        # subtitle = Text("Print a directory tree (does not respect .gitignore by default)", style="cyan italic")
+        from rich.text import Text
         
-        header_text = Text()
-        header_text.append(title)
-        # header_text.append("\n")
-        # header_text.append(subtitle)
+        # subtitle = Text("Print a directory tree (does not respect .gitignore by default)", style="cyan italic")
         
-        self.console.print(header_text)
+        # The banner never changes, print the prebuilt text (styled by Rich, so the
+        # color still follows the terminal and NO_COLOR)
+        self.console.print(Text(_BANNER, style="blue"))
 
     def _print_usage(self):
         """Print usage information."""
+        from rich import box
+        from rich.panel import Panel
+        from rich.text import Text
+        
         usage_text = Text()
         usage_text.append("gitree ", style="bold yellow")
         usage_text.append("[OPTIONS] ", style="green")
@@ -84,6 +182,10 @@ class RichHelpFormatter(argparse.HelpFormatter):
 
     def _print_positional_args(self):
         """Print positional arguments section."""
+        from rich import box
+        from rich.panel import Panel
+        from rich.table import Table
+        
         table = Table(
             show_header=False,
             box=box.SIMPLE,
@@ -110,6 +212,10 @@ class RichHelpFormatter(argparse.HelpFormatter):
 
     def _print_general_options(self):
         """Print general options section."""
+        from rich import box
+        from rich.panel import Panel
+        from rich.table import Table
+        
         table = Table(
             show_header=False,
             box=box.SIMPLE,
@@ -152,6 +258,10 @@ class RichHelpFormatter(argparse.HelpFormatter):
 
     def _print_semantic_flags(self):
         """Print semantic flags (quick actions) section."""
+        from rich import box
+        from rich.panel import Panel
+        from rich.table import Table
+        
         table = Table(
             show_header=False,
             box=box.SIMPLE,
@@ -191,173 +301,3 @@ class RichHelpFormatter(argparse.HelpFormatter):
             padding=(0, 1)
         )
         self.console.print(panel)
-
-    def _print_output_options(self):
-        """Print output & export options section."""
-        table = Table(
-            show_header=False,
-            box=box.SIMPLE,
-            padding=(0, 1),
-            collapse_padding=True
-        )
-        table.add_column("Flag", style="bold yellow", width=25)
-        table.add_column("Description", style="white")
-        
-        table.add_row(
-            "-z, --zip [FILE]",
-            "Create a zip archive of the given directory\n(respects gitignore if -g is used)"
-        )
-        table.add_row(
-            "-x, --export [FILE]",
-            "Save project structure along with its contents to a file\nwith the format specified using --format"
-        )
-        table.add_row(
-            "-c, --copy",
-            "Copy file contents and project structure to clipboard.\nSimilar to --export but copies to clipboard instead"
-        )
-        
-        panel = Panel(
-            table,
-            title="[bold white]Output & Export Options[/bold white]",
-            title_align="left",
-            box=box.ROUNDED,
-            border_style="yellow",
-            padding=(0, 1)
-        )
-        self.console.print(panel)
-
-    def _print_listing_options(self):
-        """Print listing options section."""
-        table = Table(
-            show_header=False,
-            box=box.SIMPLE,
-            padding=(0, 1),
-            collapse_padding=True
-        )
-        table.add_column("Flag", style="bold magenta", width=30)
-        table.add_column("Description", style="white")
-        
-        table.add_row(
-            "--format [tree|json|md]",
-            "Format output (default: tree)"
-        )
-        table.add_row(
-            "--max-items N",
-            "Limit items to be selected per directory"
-        )
-        table.add_row(
-            "--max-entries N",
-            "Limit entries (files/dirs) for the overall output"
-        )
-        table.add_row(
-            "--max-depth N",
-            "Maximum depth to traverse when selecting files"
-        )
-        table.add_row(
-            "-f, --full",
-            "Shortcut for --max-depth 5"
-        )
-        table.add_row(
-            "--gitignore-depth N",
-            "Limit depth to look for during .gitignore processing"
-        )
-        table.add_row(
-            "--hidden-items, --all",
-            "Show hidden files and directories"
-        )
-        table.add_row(
-            "--exclude [PATTERNS...]",
-            "Patterns of files to specifically exclude"
-        )
-        table.add_row(
-            "--exclude-depth N",
-            "Limit depth for exclude patterns"
-        )
-        table.add_row(
-            "--include [PATTERNS...]",
-            "Patterns of files to specifically include"
-        )
-        table.add_row(
-            "--include-file-types [TYPES...]",
-            "Include files of certain types"
-        )
-        table.add_row(
-            "-e, --emoji",
-            "Show emojis in the output"
-        )
-        table.add_row(
-            "-i, --interactive",
-            "Use interactive mode for further file selection"
-        )
-        table.add_row(
-            "--files-first",
-            "Print files before directories"
-        )
-        table.add_row(
-            "--no-color",
-            "Disable colored output"
-        )
-        table.add_row(
-            "--no-contents",
-            "Don't include file contents in export/copy"
-        )
-        table.add_row(
-            "--no-contents-for [PATHS...]",
-            "Exclude contents for specific files for export/copy"
-        )
-        table.add_row(
-            "--max-file-size MB",
-            "Maximum file size in MB to include in exports (default: 1.0)"
-        )
-        table.add_row(
-            "--override-files",
-            "Override existing files"
-        )
-        
-        panel = Panel(
-            table,
-            title="[bold white]Listing Options[/bold white]",
-            title_align="left",
-            box=box.ROUNDED,
-            border_style="magenta",
-            padding=(0, 1)
-        )
-        self.console.print(panel)
-
-    def _print_listing_override_options(self):
-        """Print listing override options section."""
-        table = Table(
-            show_header=False,
-            box=box.SIMPLE,
-            padding=(0, 1),
-            collapse_padding=True
-        )
-        table.add_column("Flag", style="bold red", width=25)
-        table.add_column("Description", style="white")
-        
-        table.add_row(
-            "--no-max-entries",
-            "Disable --max-entries limit"
-        )
-        table.add_row(
-            "--no-max-items",
-            "Disable --max-items limit"
-        )
-        table.add_row(
-            "-g, --gitignore",
-            "Enable .gitignore rules (respects .gitignore files)"
-        )
-        table.add_row(
-            "--no-files",
-            "Hide files (show only directories)"
-        )
-        
-        panel = Panel(
-            table,
-            title="[bold white]Listing Override Options[/bold white]",
-            title_align="left",
-            box=box.ROUNDED,
-            border_style="red",
-            padding=(0, 1)
-        )
-        self.console.print(panel)
@@ -12,6 +12,17 @@ import argparse
 from ...objects.app_context import AppContext
 
 
+# Extensions selected by --code, built once at import
+_CODE_EXTS = (
+    "py", "js", "ts", "java", "c", "cpp", "h",
+    "cs", "go", "rs", "rb", "php",
+    "swift", "kt", "scala", "dart",
+    "r", "lua", "sh")
+
+# Output flags that lift the listing limits, see _set_dependent_semantics()
+_OUTPUT_FLAGS = ("zip", "export", "copy")
+
+
 class SemanticProcessingService:
     """
     Service responsible for processing semantic flags into other flags.
@@ -35,63 +46,59 @@ class SemanticProcessingService:
         # REAL Simulation of smart behaviour here
         SemanticProcessingService._set_dependent_semantics(ctx, args)
         
+        # Flags default to argparse.SUPPRESS, so a given flag is simply a key in the
+        # namespace dict, checked, set and removed with plain dict operations
+        opts = vars(args)
 
         # Implementation for --code flag
-        if getattr(args, "code", False):
-            args.only_types = [
-                "py", "js", "ts", "java", "c", "cpp", "h",
-                "cs", "go", "rs", "rb", "php",
-                "swift", "kt", "scala", "dart",
-                "r", "lua", "sh"]
+        if opts.get("code"):
+            opts["only_types"] = _CODE_EXTS
             ctx.logger.log(ctx.logger.DEBUG, 
-                          f"--code: Setting only_types to {len(args.only_types)} common code extensions")
+                          "--code: Setting only_types to %d common code extensions", len(_CODE_EXTS))
             
-            del args.code
+            del opts["code"]
 
 
         # Implementation for --no-limit flag
-        if getattr(args, "no_limit", False):
-            args.no_max_entries = True
-            args.no_max_items = True
-            args.no_max_depth = True
+        if opts.get("no_limit"):
+            opts.update(no_max_entries=True, no_max_items=True, no_max_depth=True)
             ctx.logger.log(ctx.logger.DEBUG, 
                           "--no-limit: Setting no_max_entries=True and no_max_items=True")
             
-            del args.no_limit
+            del opts["no_limit"]
 
 
         # Implementation for --full flag
-        if getattr(args, "full", False):
-            args.max_depth = 5
+        if opts.get("full"):
+            opts["max_depth"] = 5
             ctx.logger.log(ctx.logger.DEBUG, "--full: Setting max_depth=5")
-            del args.full
+            del opts["full"]
 
 
         # Implementation for --only-types flag
         # OPTIMIZED: Store extensions directly instead of converting to glob patterns
         # Filtering happens during traversal which is much faster than glob.glob()
-        if getattr(args, "only_types", None):
-            exts = []
-
-            for e in args.only_types:
-                e = e.lower().lstrip(".")
-                if e:
-                    exts.append(e)
+        only_types = opts.pop("only_types", None)
+        if only_types:
+            # Normalized and deduplicated here, the one place --only-types (and --code)
+            # are processed, keeping the order they were given in
+            exts = list(dict.fromkeys(
+                e for e in (t.lower().lstrip(".") for t in only_types) if e))
 
             # Store extensions for filtering during traversal
-            args.file_extensions = exts
+            opts["file_extensions"] = exts
                 
             ctx.logger.log(ctx.logger.DEBUG, 
-                          f"--only-types: Will filter for extensions {exts} during traversal")
-            del args.only_types
+                          "--only-types: Will filter for extensions %s during traversal", exts)
         else:
             # Ensure file_extensions exists even if not using --only-types
-            args.file_extensions = []
+            opts["file_extensions"] = []
 
 
         return args
 
 
+    @staticmethod
     def _set_dependent_semantics(ctx: AppContext, args: argparse.Namespace) -> argparse.Namespace:
         """
         Set dependent argument values based on semantic flags.
@@ -105,10 +112,12 @@ class SemanticProcessingService:
         """
         
         # Use no-limit if outputting to file or zip or copy
-        if getattr(args, "zip", False) or getattr(args, "export", False) or getattr(args, "copy", False):
-            args.no_limit = True
+        # One dict lookup per output flag (map() runs them in C), no getattr() defaults
+        opts = vars(args)
+        if any(map(opts.get, _OUTPUT_FLAGS)):
+            opts["no_limit"] = True
             ctx.logger.log(ctx.logger.DEBUG, 
-                          "--detailed: Setting verbose=True")
+                          "--zip/--export/--copy: Setting no_limit=True")
 
 
         return args 
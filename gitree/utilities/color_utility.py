@@ -41,6 +41,7 @@ class Color:
     def _wrap(code: str, text: str, reset: str=RESET) -> str:
         return f"{code}{text}{reset}"
 
+    @staticmethod
     def default(text: str) -> str:
         return Color._wrap("", text, "")
 
@@ -5,6 +5,7 @@ Utility functions for the tool.
 """
 
 # Default libs
+import os
 import sys
 from typing import NoReturn
 import argparse
@@ -63,3 +64,28 @@ def error_and_exit(message: str, code: int = 1) -> NoReturn:
     """
     print(f"Error: {message}", file=sys.stderr)
     sys.exit(code)
+
+
+def is_under_str(path_str: str, parent_str: str) -> bool:
+    """
+    Check if a path is the parent path itself or under it, on the string forms
+    of absolute, resolved paths. Same result as path == parent or
+    path.is_relative_to(parent), without parsing the paths into parts.
+
+    Args:
+        path_str (str): The path to check
+        parent_str (str): The potential parent path
+
+    Returns:
+        bool: True if path is under (or equal to) parent
+    """
+    if os.name == "nt":     # Windows paths compare case-insensitively
+        path_str, parent_str = os.path.normcase(path_str), os.path.normcase(parent_str)
+
+    if path_str == parent_str:
+        return True
+
+    # Separator guard, so that "/a/bc" is not under "/a/b" (the root already ends with it)
+    if not parent_str.endswith(os.sep):
+        parent_str += os.sep
+    return path_str.startswith(parent_str)
@@ -12,6 +12,7 @@ from typing import Optional
 from ..objects.gitignore import GitIgnore
 from ..objects.app_context import AppContext
 from ..objects.config import Config
+from .functions_utility import is_under_str
 
 
 class GitIgnoreMatcher:
@@ -33,6 +34,32 @@ class GitIgnoreMatcher:
         
         # Cache size limit to prevent memory bloat
         self._max_cache_size: int = 10000
+        
+        # Compiled gitignores by directory, each .gitignore is parsed only once
+        self._compiled_cache: dict[str, GitIgnore] = {}
+    
+    def load_gitignore(self, ctx: AppContext, config: Config, dir_path: Path) -> GitIgnore:
+        """
+        Compile the .gitignore of a directory and add it for scope-based matching.
+        A directory already loaded reuses its compiled GitIgnore and is not added twice.
+        
+        Args:
+            ctx: Application context
+            config: Configuration object
+            dir_path: The directory containing the .gitignore
+            
+        Returns:
+            The compiled GitIgnore of the directory
+        """
+        dir_key = str(dir_path)
+        gitignore = self._compiled_cache.get(dir_key)
+        
+        if gitignore is None:
+            gitignore = GitIgnore(ctx, config, dir_path / ".gitignore")
+            self._compiled_cache[dir_key] = gitignore
+            self.add_gitignore(gitignore, dir_path)
+        
+        return gitignore
     
     def add_gitignore(self, gitignore: GitIgnore, root_path: Path):
         """
@@ -46,12 +73,15 @@ class GitIgnoreMatcher:
         # Clear cache when new gitignore is added
         self._exclusion_cache.clear()
     
-    def excluded(self, item_path: Path) -> bool:
+    def excluded(self, item_path: Path, is_dir: Optional[bool] = None,
+                 resolved: bool = False) -> bool:
         """
         Check if a path is excluded by any applicable gitignore, with caching.
         
         Args:
             item_path: Path to check for exclusion
+            is_dir: Whether the path is a directory, if already known (saves a stat)
+            resolved: Whether the path is known to be resolved already (saves a resolve)
             
         Returns:
             True if the path is excluded, False otherwise
@@ -70,7 +100,7 @@ class GitIgnoreMatcher:
             if not self._is_path_in_scope(item_path, root_path):
                 continue
                 
-            if gitignore.excluded(item_path):
+            if gitignore.excluded(item_path, is_dir, resolved):
                 result = True
                 break
         
@@ -95,11 +125,7 @@ class GitIgnoreMatcher:
         Returns:
             True if item_path is under gitignore_root
         """
-        try:
-            item_path.relative_to(gitignore_root)
-            return True
-        except ValueError:
-            return False
+        return is_under_str(str(item_path), str(gitignore_root))
     
     def clear_cache(self):
         """Clear the exclusion cache. Useful when switching directories."""
@@ -0,0 +1,51 @@
+# gitree/utilities/json_utility.py
+
+"""
+JSON helpers for the tool.
+
+Uses orjson (a much faster C/Rust encoder) when it is installed and falls
+back to the standard json module otherwise.
+"""
+
+# Default libs
+from typing import Any
+
+# Optional deps, the standard json module is only imported as the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize obj to a JSON string. Non-ASCII characters are kept as is.
+
+    Args:
+        obj (Any): The object to serialize
+        indent (bool): Pretty-print with an indent of 2 spaces (default: False)
+
+    Returns:
+        str: The JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Parse a JSON document into python objects.
+
+    Args:
+        data (str | bytes): The JSON document
+
+    Returns:
+        Any: The parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
@@ -4,6 +4,10 @@
 Code file for housing Logger and OutputBuffer classes.
 """
 
+# Default libs
+import sys
+
+# Deps from this project
 from ..utilities.color_utility import Color
 
 
@@ -33,21 +37,32 @@ class Logger:
             30: "WARNING",
             40: "ERROR",
         }
-        self._messages: list[str] = []
+        # Plain strings, or (level, message, args) records formatted only when read
+        self._messages: list[str | tuple] = []
+
+        # Turned off once it is known the log will never be printed (no --verbose)
+        self.enabled: bool = True
 
 
-    def log(self, level: str | None, message: str) -> None:
+    def log(self, level: int | None, message: str, *args) -> None:
         """
-        Store a debug message.
+        Store a debug message. Formatting is deferred like in the stdlib logging:
+        the level label and any %-style args are only applied when the messages
+        are read, which for the log only happens in verbose mode.
 
         Args:
-            message: The debug message to store
+            level: The log level, None for a plain message
+            message: The debug message to store, may contain %-style placeholders
+            args: Values for the placeholders in message
         """
 
-        if level is None:
+        if not self.enabled:
+            return
+
+        if level is None and not args:
             self._messages.append(message)
         else:
-            self._messages.append(self._append_level(level, message))
+            self._messages.append((level, message, args))
 
 
     def flush(self) -> None:
@@ -59,8 +74,7 @@ class Logger:
             print("No log messages to display.")
             return
         
-        for message in self._messages:
-            print(message)
+        self._write_all()
         self.clear()
 
 
@@ -74,10 +88,10 @@ class Logger:
     
     def empty(self) -> bool:
         """ 
-        Check if the logger is empty. Uses the __len__ function.
+        Check if the logger is empty.
         """
 
-        return len(self) == 0
+        return not self._messages
     
 
     def get_logs(self) -> list[str]:
@@ -88,7 +102,7 @@ class Logger:
             List[str]: a list of the stored messages
         """
 
-        return self._messages.copy()
+        return [self._render(message) for message in self._messages]
 
 
     def __len__(self) -> int:
@@ -100,6 +114,46 @@ class Logger:
         """
 
         return len(self._messages)
+
+
+    def __iter__(self):
+        """
+        Iterate over the stored messages without copying them.
+
+        Returns:
+            Iterator over the messages in the buffer
+        """
+
+        return map(self._render, self._messages)
+
+
+    def _write_all(self) -> None:
+        """
+        Print all stored messages, one line each, with a single write to stdout
+        instead of one print() per message. Iterates the buffer without copying it.
+        """
+
+        sys.stdout.write("\n".join(self) + "\n")
+
+
+    def _render(self, message: str | tuple) -> str:
+        """
+        Format a stored message, see log().
+
+        Args:
+            message: A plain message or a (level, message, args) record
+
+        Returns:
+            The message as it is printed
+        """
+
+        if isinstance(message, str):
+            return message
+
+        level, text, args = message
+        if args:
+            text = text % args
+        return text if level is None else self._append_level(level, text)
     
 
     def _append_level(self, level: str, message: str) -> str:
@@ -171,8 +225,7 @@ class OutputBuffer(Logger):
         if super().empty():
             return      # Do not print anything
 
-        for message in self.get_value():
-            print(message)
+        self._write_all()
     
 
 class TipsBuffer(Logger):
@@ -216,6 +269,5 @@ class TipsBuffer(Logger):
         if super().empty():
             return      # Do not print anything
 
-        for message in self.get_value():
-            print(message)
+        self._write_all()
     
\ No newline at end of file
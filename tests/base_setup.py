@@ -5,29 +5,150 @@ Code file for the BaseCliSetup. All test classes should inherit
 from this root class.
 """
 
+import io
+import os
 import unittest
 import tempfile
+import shutil
 import subprocess
 import sys
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
+from types import SimpleNamespace
+
+from gitree.main import main as gitree_main
+
+
+# Temporary dirs are named per process, so the dirs of parallel test workers
+# (e.g. pytest -n auto) can be told apart. The "tmp" start is tempfile's own
+# default prefix, which tests look for in the printed root name
+_TMP_PREFIX = f"tmp-gitree-{os.getpid()}-"
+
+# Temporary dirs go to the RAM-backed /dev/shm where there is one, set
+# GITREE_TEST_TMPFS=0 to run the tests against the default (disk) temp dir
+_TMP_DIR = ("/dev/shm" if os.environ.get("GITREE_TEST_TMPFS", "1") != "0" and
+    os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK | os.X_OK) else None)
+
+
+def has_non_ascii(text: str) -> bool:
+    """
+    Check if text has any non-ASCII character (emojis, box drawing, ...).
+    str.isascii() answers from the string's internal kind, without a scan.
+    """
+
+    return not text.isascii()
 
 
 class BaseCLISetup(unittest.TestCase):
     """
     Base class for CLI setup.
     Inherit from this class to create test classes with reusable setup.
+
+    Sample files shared by all tests of a class go in FIXTURE (or make_fixture()).
+    They are written once per class and hard-linked into the directory of each
+    test, so tests may add files next to them but must not rewrite them in place.
     """
 
+    # Sample files as (relative posix path, contents) pairs, see make_fixture()
+    FIXTURE: tuple[tuple[str, bytes], ...] = ()
+
+
+    @classmethod
+    def make_fixture(cls, root: Path) -> None:
+        """
+        Create the sample files shared by all tests of the class under root.
+        The default writes the FIXTURE files.
+        """
+
+        BaseCLISetup._write_files(str(root), cls.FIXTURE)
+
+
+    def write_files(self, *files: tuple[str, bytes]) -> None:
+        """
+        Write extra sample files for a single test, under self.root. A file that
+        is already there is replaced, never rewritten in place, as it may be a
+        hard link to the class fixture.
+
+        Args:
+            files (tuple[str, bytes]): (relative posix path, contents) pairs
+        """
+
+        BaseCLISetup._write_files(str(self.root), files, replace=True)
+
+
+    @staticmethod
+    def _write_files(root_str: str, files, replace: bool = False) -> None:
+        """
+        Write (relative posix path, contents) pairs under root_str, on plain path
+        strings, each parent dir created once. With replace, existing files are
+        unlinked first.
+        """
+
+        paths = [(os.path.join(root_str, *rel.split("/")), content)
+            for rel, content in files]
+
+        for dir_path in dict.fromkeys(os.path.dirname(path) for path, _ in paths):
+            os.makedirs(dir_path, exist_ok=True)
+
+        for path, content in paths:
+            if replace:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, content)
+            finally:
+                os.close(fd)
+
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Build the class fixture once, in a temporary directory kept for the class.
+        """
+
+        cls._fixture_dir = tempfile.TemporaryDirectory(prefix=_TMP_PREFIX, dir=_TMP_DIR)
+        cls.make_fixture(Path(cls._fixture_dir.name))
+
+        # Caches written by gitree (the rendered --help) go to a fresh dir of the
+        # class, never to the user's cache, and each class renders them again
+        cls._cache_dir = tempfile.TemporaryDirectory(prefix=_TMP_PREFIX, dir=_TMP_DIR)
+        cls._saved_cache_home = os.environ.get("XDG_CACHE_HOME")
+        os.environ["XDG_CACHE_HOME"] = cls._cache_dir.name
+
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Cleanup the class fixture and cache dir after all tests of the class.
+        """
+
+        cls._fixture_dir.cleanup()
+
+        if cls._saved_cache_home is None:
+            os.environ.pop("XDG_CACHE_HOME", None)
+        else:
+            os.environ["XDG_CACHE_HOME"] = cls._saved_cache_home
+        cls._cache_dir.cleanup()
+
+
     def setUp(self):
         """
-        Create a temporary directory for each test.
+        Create a temporary directory for each test, holding the class fixture.
 
         Use self.root everywhere to create temporary files
         """
 
-        self._tmpdir = tempfile.TemporaryDirectory()
+        self._tmpdir = tempfile.TemporaryDirectory(prefix=_TMP_PREFIX, dir=_TMP_DIR)
         self.root = Path(self._tmpdir.name)
 
+        # Hard links clone the fixture without copying any file contents
+        shutil.copytree(self._fixture_dir.name, self.root,
+            copy_function=BaseCLISetup._link_or_copy, dirs_exist_ok=True)
+
         # Vars to be used for all other tests
         self.base_call = "gitree "
 
@@ -45,15 +166,50 @@ class BaseCLISetup(unittest.TestCase):
         Helper to run gitree with the CLI consistently. The path given to the tool is
         the temporary dir path.
 
+        The tool runs in this process, on the given argv and with the temporary dir
+        as the cwd, so a test does not pay for a new interpreter and gitree import.
+        Use run_gitree_subprocess() for runs that need a real process.
+
         Args:
             args (tuple): extra CLI arguments, e.g. "--max-depth 1", "--help", "--zip output.zip"
+
+        Returns:
+            An object with the returncode, stdout and stderr of the run
         """
-        # Handle both single string and multiple args
-        if len(args) == 1 and isinstance(args[0], str):
-            # Split the string into individual arguments
-            cmd_args = args[0].split() if args[0] else []
-        else:
-            cmd_args = list(args)
+        cmd_args = self._cmd_args(args)
+        out, err = io.StringIO(), io.StringIO()
+        saved_argv, saved_cwd = sys.argv, os.getcwd()
+
+        sys.argv = ["gitree"] + cmd_args
+        os.chdir(self.root)
+        try:
+            with redirect_stdout(out), redirect_stderr(err):
+                gitree_main()
+            returncode = 0
+        except SystemExit as e:
+            # sys.exit() with a message prints it to stderr and exits with 1
+            if isinstance(e.code, str):
+                err.write(e.code + "\n")
+                returncode = 1
+            else:
+                returncode = e.code or 0
+        finally:
+            sys.argv = saved_argv
+            os.chdir(saved_cwd)
+
+        return SimpleNamespace(returncode=returncode,
+            stdout=out.getvalue(), stderr=err.getvalue())
+
+
+    def run_gitree_subprocess(self, *args):
+        """
+        Helper to run gitree in a new process, for runs that need process
+        isolation (clipboard, interactive mode, ...).
+
+        Args:
+            args (tuple): extra CLI arguments, same as for run_gitree()
+        """
+        cmd_args = self._cmd_args(args)
 
         return subprocess.run(
             [sys.executable, "-m", "gitree.main"] + cmd_args,
@@ -65,6 +221,52 @@ class BaseCLISetup(unittest.TestCase):
         )
 
 
+    @staticmethod
+    def _link_or_copy(src: str, dst: str) -> None:
+        """
+        Hard-link a fixture file, or copy it where the filesystem has no hard links.
+        """
+
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+
+
+    @staticmethod
+    def _cmd_args(args: tuple) -> list[str]:
+        """
+        Turn the args given to the run helpers into an argv list.
+        """
+        # Handle both single string and multiple args
+        if len(args) == 1 and isinstance(args[0], str):
+            # Split the string into individual arguments
+            return args[0].split() if args[0] else []
+
+        return list(args)
+
+
+    def assert_substrings(self, args_str: str, text: str,
+        present: tuple[str, ...] = (), absent: tuple[str, ...] = ()) -> None:
+        """
+        Assert that all present strings are in text and none of the absent ones,
+        as one assertion reporting every mismatch at once.
+
+        Args:
+            args_str (str): The args of the run, for the failure message
+            text (str): The output to check
+            present (tuple[str, ...]): Strings expected in text
+            absent (tuple[str, ...]): Strings not expected in text
+        """
+
+        missing = [s for s in present if s not in text]
+        unexpected = [s for s in absent if s in text]
+
+        self.assertFalse(missing or unexpected,
+            msg=self.failed_run_msg(args_str) +
+                f"Missing {missing}, unexpected {unexpected} in output: \n\n{text}")
+
+
     def failed_run_msg(self, args_str: str) -> str:
         """
         Generate message for the failed run.
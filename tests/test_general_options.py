@@ -6,11 +6,15 @@ Code file for TestGeneralOptions class.
 Tests general CLI options shown in gt -h:
     - No arguments (default behavior)
     - --version
-    - --help
+    - --help (and its rendering cache)
     - --verbose
     - --no-config
 """
 
+import os
+import shutil
+from pathlib import Path
+
 from tests.base_setup import BaseCLISetup
 
 
@@ -98,6 +102,44 @@ class TestGeneralOptions(BaseCLISetup):
                 f"Expected help content not found in output: \n\n{result.stdout}")
 
 
+    def test_help_cache(self):
+        """
+        Test if the rendered help is cached, once, and the cache can be disabled
+        using: --help, twice, then with GITREE_NO_HELP_CACHE set
+        """
+        # Vars
+        args_str = "--help"
+        cache_dir = Path(os.environ["XDG_CACHE_HOME"]) / "gitree"
+
+        # Test - the second run prints the cached rendering
+        first = self.run_gitree(args_str)
+        second = self.run_gitree(args_str)
+
+        # Validate
+        self.assertEqual(second.stdout, first.stdout,
+            msg=self.failed_run_msg(args_str) +
+                f"Cached help differs from the rendered one: \n\n{second.stdout}")
+        self.assertEqual(len(list(cache_dir.glob("help-*.ansi"))), 1,
+            msg=self.failed_run_msg(args_str) +
+                f"Expected a single cached help in {cache_dir}")
+
+        # Test - without the cache, nothing is written
+        shutil.rmtree(cache_dir)
+        os.environ["GITREE_NO_HELP_CACHE"] = "1"
+        try:
+            result = self.run_gitree(args_str)
+        finally:
+            del os.environ["GITREE_NO_HELP_CACHE"]
+
+        # Validate
+        self.assertEqual(result.stdout, first.stdout,
+            msg=self.failed_run_msg(args_str) +
+                f"Uncached help differs from the cached one: \n\n{result.stdout}")
+        self.assertFalse(cache_dir.exists(),
+            msg=self.failed_run_msg(args_str) +
+                f"Help cached in {cache_dir} with GITREE_NO_HELP_CACHE set")
+
+
     def test_verbose(self):
         """
         Test if the logging utility is working properly
@@ -0,0 +1,151 @@
+# tests/test_listing_options.py
+
+"""
+Code file for TestListingOptions class.
+
+Tests listing options:
+    - Dependency/build dirs skipped by default (always_skip_dirs)
+    - --hidden-items showing the skipped dirs
+    - --gitignore rules, with and without negated patterns, and without any pattern
+    - --files-first ordering
+"""
+
+import re
+
+from tests.base_setup import BaseCLISetup
+
+
+# A file listed before the src dir, checked in one search over the output
+_FILES_FIRST_RE = re.compile(r"random_file\.txt.*?src", re.DOTALL)
+
+
+class TestListingOptions(BaseCLISetup):
+    """
+    Tests listing options, including:
+        - Skipping well-known dependency/build dirs by default
+        - Showing them again with hidden items (--hidden-items)
+        - Applying .gitignore rules (--gitignore)
+        - Listing files before dirs (--files-first)
+    """
+
+    # Sample directory structure
+    FIXTURE = (
+        ("src/main.py", b"print('hello')"),
+        ("node_modules/index.js", b"module.exports = 1"),
+    )
+
+
+    def test_skip_dirs_by_default(self):
+        """
+        Test the default listing
+        Should show src but leave out node_modules
+        """
+        # Vars
+        args_str = "--no-config"
+
+        # Run
+        result = self.run_gitree(args_str)
+
+        # Validate
+        self.assertEqual(result.returncode, 0,
+            msg=self.failed_run_msg(args_str) +
+                self.non_zero_exitcode_msg(result.returncode))
+
+        self.assertIn("src", result.stdout,
+            msg=self.failed_run_msg(args_str) +
+                f"'src' not found in output: \n\n{result.stdout}")
+
+        self.assertNotIn("node_modules", result.stdout,
+            msg=self.failed_run_msg(args_str) +
+                f"Skipped dir 'node_modules' found in output: \n\n{result.stdout}")
+
+
+    def test_hidden_items_shows_skipped_dirs(self):
+        """
+        Test --hidden-items
+        Should show node_modules as well
+        """
+        # Vars
+        args_str = "--no-config --hidden-items"
+
+        # Run
+        result = self.run_gitree(args_str)
+
+        # Validate
+        self.assertEqual(result.returncode, 0,
+            msg=self.failed_run_msg(args_str) +
+                self.non_zero_exitcode_msg(result.returncode))
+
+        self.assertIn("node_modules", result.stdout,
+            msg=self.failed_run_msg(args_str) +
+                f"'node_modules' not found in output: \n\n{result.stdout}")
+
+
+    def test_gitignore(self):
+        """
+        Test --gitignore
+        Should leave out ignored files and dirs, but keep files re-included with "!"
+        """
+        # Vars
+        args_str = "--no-config --gitignore --max-depth 3"
+        self.write_files(
+            (".gitignore", b"*.log\ngenerated/\n"),
+            ("src/.gitignore", b"*.tmp\n!keep.tmp\n"),
+            ("debug.log", b"log"),
+            ("generated/gen.txt", b"gen"),
+            ("src/cache.tmp", b"tmp"),
+            ("src/keep.tmp", b"tmp"),
+        )
+
+        # Run
+        result = self.run_gitree(args_str)
+
+        # Validate
+        self.assertEqual(result.returncode, 0,
+            msg=self.failed_run_msg(args_str) +
+                self.non_zero_exitcode_msg(result.returncode))
+
+        self.assert_substrings(args_str, result.stdout,
+            present=("main.py", "keep.tmp"), absent=("debug.log", "generated", "gen.txt", "cache.tmp"))
+
+
+    def test_gitignore_without_patterns(self):
+        """
+        Test --gitignore with a .gitignore that has no active patterns
+        Should exclude nothing (a bare "/" line is not a pattern)
+        """
+        # Vars
+        args_str = "--no-config --gitignore --max-depth 3"
+        self.write_files((".gitignore", b"/\n\n# comment\n"), ("notes.txt", b"notes"))
+
+        # Run
+        result = self.run_gitree(args_str)
+
+        # Validate
+        self.assertEqual(result.returncode, 0,
+            msg=self.failed_run_msg(args_str) +
+                self.non_zero_exitcode_msg(result.returncode))
+
+        self.assert_substrings(args_str, result.stdout,
+            present=("src", "main.py", "notes.txt"))
+
+    def test_files_first(self):
+        """
+        Test --files-first
+        Should list the files of a dir before its subdirs
+        """
+        # Vars
+        args_str = "--no-config --files-first"
+        self.write_files(("random_file.txt", b"random"))
+
+        # Run
+        result = self.run_gitree(args_str)
+
+        # Validate
+        self.assertEqual(result.returncode, 0,
+            msg=self.failed_run_msg(args_str) +
+                self.non_zero_exitcode_msg(result.returncode))
+
+        self.assertIsNotNone(_FILES_FIRST_RE.search(result.stdout),
+            msg=self.failed_run_msg(args_str) +
+                f"'random_file.txt' not listed before 'src' in output: \n\n{result.stdout}")
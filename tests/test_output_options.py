@@ -0,0 +1,171 @@
+# tests/test_output_options.py
+
+"""
+Code file for TestOutputOptions class.
+
+Tests output & export options:
+    - --export (tree, md and json formats)
+    - --no-contents
+    - --no-files with --export
+"""
+
+import json
+
+from tests.base_setup import BaseCLISetup
+
+
+class TestOutputOptions(BaseCLISetup):
+    """
+    Tests output & export options, including:
+        - Exporting structure and file contents (--export)
+        - Exporting in every supported format (--format)
+        - Skipping file contents in exports (--no-contents)
+    """
+
+    # Sample directory structure
+    FIXTURE = (
+        ("src/main.py", b"print('hello')\n\n"),
+        ("README.md", b"# Project"),
+    )
+
+
+    def test_export_tree(self):
+        """
+        Test --export with the default tree format
+        Should write the structure followed by the file contents
+        """
+        # Vars
+        args_str = "-x out.txt"
+
+        # Run
+        result = self.run_gitree(args_str)
+
+        # Validate
+        self.assertEqual(result.returncode, 0,
+            msg=self.failed_run_msg(args_str) +
+                self.non_zero_exitcode_msg(result.returncode))
+
+        output_path = self.root / "out.txt"
+        self.assertTrue(output_path.exists(),
+            msg=self.failed_run_msg(args_str) +
+                f"Export file not created: \n\n{result.stdout}")
+
+        content = output_path.read_text(encoding="utf-8")
+        self.assertIn("==== FILE CONTENTS ====", content,
+            msg=self.failed_run_msg(args_str) +
+                f"Expected contents header in export: \n\n{content}")
+
+        self.assertIn("print('hello')", content,
+            msg=self.failed_run_msg(args_str) +
+                f"Expected file contents in export: \n\n{content}")
+
+        self.assertNotIn("print('hello')\n\n", content,
+            msg=self.failed_run_msg(args_str) +
+                f"Trailing newlines of file contents not stripped: \n\n{content}")
+
+
+    def test_export_md(self):
+        """
+        Test --export with --format md
+        Should write file contents inside fenced code blocks
+        """
+        # Vars
+        args_str = "--format md -x out.md"
+
+        # Run
+        result = self.run_gitree(args_str)
+
+        # Validate
+        self.assertEqual(result.returncode, 0,
+            msg=self.failed_run_msg(args_str) +
+                self.non_zero_exitcode_msg(result.returncode))
+
+        content = (self.root / "out.md").read_text(encoding="utf-8")
+        self.assertIn("## Files", content,
+            msg=self.failed_run_msg(args_str) +
+                f"Expected files section in export: \n\n{content}")
+
+        self.assertIn("```text\nprint('hello')\n```", content,
+            msg=self.failed_run_msg(args_str) +
+                f"Expected fenced file contents in export: \n\n{content}")
+
+
+    def test_export_json(self):
+        """
+        Test --export with --format json
+        Should write valid json with the structure and every file
+        """
+        # Vars
+        args_str = "--format json -x out.json"
+
+        # Run
+        result = self.run_gitree(args_str)
+
+        # Validate
+        self.assertEqual(result.returncode, 0,
+            msg=self.failed_run_msg(args_str) +
+                self.non_zero_exitcode_msg(result.returncode))
+
+        payload = json.loads((self.root / "out.json").read_text(encoding="utf-8"))
+        contents = {entry["path"].replace("\\", "/").split("/")[-1]: entry["content"]
+            for entry in payload["files"]}
+
+        self.assertTrue(payload["structure"],
+            msg=self.failed_run_msg(args_str) +
+                f"Expected structure in export: \n\n{payload}")
+
+        self.assertEqual(contents.get("README.md"), "# Project",
+            msg=self.failed_run_msg(args_str) +
+                f"Expected README.md contents in export: \n\n{payload}")
+
+
+    def test_no_contents(self):
+        """
+        Test --no-contents together with --export
+        Should write only the structure
+        """
+        # Vars
+        args_str = "-x out.txt --no-contents"
+
+        # Run
+        result = self.run_gitree(args_str)
+
+        # Validate
+        self.assertEqual(result.returncode, 0,
+            msg=self.failed_run_msg(args_str) +
+                self.non_zero_exitcode_msg(result.returncode))
+
+        content = (self.root / "out.txt").read_text(encoding="utf-8")
+        self.assertIn("main.py", content,
+            msg=self.failed_run_msg(args_str) +
+                f"Expected structure in export: \n\n{content}")
+
+        self.assertNotIn("print('hello')", content,
+            msg=self.failed_run_msg(args_str) +
+                f"Did not expect file contents in export: \n\n{content}")
+
+
+    def test_export_without_files(self):
+        """
+        Test --export together with --no-files
+        Should not write an empty file contents section
+        """
+        # Vars
+        args_str = "-x out.txt --no-files"
+
+        # Run
+        result = self.run_gitree(args_str)
+
+        # Validate
+        self.assertEqual(result.returncode, 0,
+            msg=self.failed_run_msg(args_str) +
+                self.non_zero_exitcode_msg(result.returncode))
+
+        content = (self.root / "out.txt").read_text(encoding="utf-8")
+        self.assertIn("src", content,
+            msg=self.failed_run_msg(args_str) +
+                f"Expected structure in export: \n\n{content}")
+
+        self.assertNotIn("==== FILE CONTENTS ====", content,
+            msg=self.failed_run_msg(args_str) +
+                f"Did not expect a file contents section in export: \n\n{content}")
@@ -10,8 +10,9 @@ Tests all semantic flags (quick actions) that are shown in gt -h:
     - --only-types
 """
 
-from tests.base_setup import BaseCLISetup
+from tests.base_setup import BaseCLISetup, has_non_ascii
 from pathlib import Path
+from unittest import mock
 
 
 class TestSemanticOptions(BaseCLISetup):
@@ -23,23 +24,15 @@ class TestSemanticOptions(BaseCLISetup):
         - Filter by file types (--only-types)
     """
 
-    def setUp(self):
-        """
-        Set up test environment with sample files.
-        """
-        super().setUp()
-        
-        # Create sample directory structure
-        (self.root / "src").mkdir()
-        (self.root / "src" / "main.py").write_text("print('hello')")
-        (self.root / "src" / "utils.py").write_text("def helper(): pass")
-        (self.root / "src" / "app.js").write_text("console.log('test')")
-        
-        (self.root / "tests").mkdir()
-        (self.root / "tests" / "test_main.py").write_text("def test(): pass")
-        
-        (self.root / "README.md").write_text("# Project")
-        (self.root / "config.json").write_text('{"key": "value"}')
+    # Sample directory structure
+    FIXTURE = (
+        ("src/main.py", b"print('hello')"),
+        ("src/utils.py", b"def helper(): pass"),
+        ("src/app.js", b"console.log('test')"),
+        ("tests/test_main.py", b"def test(): pass"),
+        ("README.md", b"# Project"),
+        ("config.json", b'{"key": "value"}'),
+    )
 
 
     def test_full(self):
@@ -89,7 +82,7 @@ class TestSemanticOptions(BaseCLISetup):
                 self.no_output_msg())
 
         # Check for emoji characters
-        has_emoji = any(ord(c) > 127 for c in result.stdout)
+        has_emoji = has_non_ascii(result.stdout)
         self.assertTrue(has_emoji,
             msg=self.failed_run_msg(args_str) +
                 f"No emojis found in output: \n\n{result.stdout}")
@@ -120,7 +113,7 @@ class TestSemanticOptions(BaseCLISetup):
             msg=self.failed_run_msg(args_str) +
                 f"Expected 'src' in output: \n\n{result.stdout}")
 
-        has_emoji = any(ord(c) > 127 for c in result.stdout)
+        has_emoji = has_non_ascii(result.stdout)
         self.assertTrue(has_emoji,
             msg=self.failed_run_msg(args_str) +
                 f"No emojis found in combined flag output: \n\n{result.stdout}")
@@ -146,16 +139,50 @@ class TestSemanticOptions(BaseCLISetup):
             msg=self.failed_run_msg(args_str) +
                 self.no_output_msg())
 
-        # Should show Python files
-        self.assertIn("main.py", result.stdout,
-            msg=self.failed_run_msg(args_str) +
-                f"Expected 'main.py' in output: \n\n{result.stdout}")
+        # Should show Python files, but not JavaScript files
+        self.assert_substrings(args_str, result.stdout,
+            present=("main.py", "utils.py"), absent=("app.js",))
 
-        self.assertIn("utils.py", result.stdout,
-            msg=self.failed_run_msg(args_str) +
-                f"Expected 'utils.py' in output: \n\n{result.stdout}")
 
-        # Should not show JavaScript files
-        self.assertNotIn("app.js", result.stdout,
+    def test_copy(self):
+        """
+        Test --copy flag
+        Should copy the structure and the file contents as text, in tree and md format
+        """
+        for args_str in ("--copy", "--copy --format md"):
+            with self.subTest(args=args_str):
+                # Run, with the clipboard mocked
+                with mock.patch("pyperclip.copy") as copy:
+                    result = self.run_gitree(args_str)
+
+                # Validate
+                self.assertEqual(result.returncode, 0,
+                    msg=self.failed_run_msg(args_str) +
+                        self.non_zero_exitcode_msg(result.returncode) + result.stderr)
+
+                copy.assert_called_once()
+                copied = copy.call_args.args[0]
+                self.assertIsInstance(copied, str)
+                self.assert_substrings(args_str, copied,
+                    present=("main.py", "print('hello')", "console.log('test')"))
+
+
+    def test_only_types_ignores_case(self):
+        """
+        Test --only-types with differently cased extensions
+        Should match file extensions case-insensitively, long extensions included
+        """
+        # Vars
+        args_str = "-f --only-types properties PY"
+        self.write_files(("src/App.Properties", b"key=value"), ("src/Tool.Py", b"pass"))
+
+        # Run
+        result = self.run_gitree(args_str)
+
+        # Validate
+        self.assertEqual(result.returncode, 0,
             msg=self.failed_run_msg(args_str) +
-                f"Did not expect 'app.js' in output: \n\n{result.stdout}")
+                self.non_zero_exitcode_msg(result.returncode))
+
+        self.assert_substrings(args_str, result.stdout,
+            present=("App.Properties", "Tool.Py", "main.py"), absent=("app.js",))